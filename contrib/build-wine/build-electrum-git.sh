@@ -36,8 +36,7 @@ export FROZENLIST_NO_EXTENSIONS=1
 info "Installing requirements..."
 #$WINE_PYTHON -m pip install --no-build-isolation --no-dependencies --no-binary :all: --no-warn-script-location \
 #    --cache-dir "$WINE_PIP_CACHE_DIR" -r "$CONTRIB"/deterministic-build/requirements.txt
-# wine has trouble compiling recordclass
-$WINE_PYTHON -m pip install --no-build-isolation --no-dependencies --no-binary :all: --only-binary recordclass --no-warn-script-location \
+$WINE_PYTHON -m pip install --no-build-isolation --no-dependencies --no-binary :all: --no-warn-script-location \
     --cache-dir "$WINE_PIP_CACHE_DIR" -r "$CONTRIB"/deterministic-build/requirements.txt
 
 info "Installing dependencies specific to binaries..."
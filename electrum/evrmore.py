@@ -559,6 +559,9 @@ assert len(__b58chars) == 58
 
 __b43chars = b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ$*+-./:'
 assert len(__b43chars) == 43
+# byte value -> digit, for decoding
+__b58digits = {c: i for i, c in enumerate(__b58chars)}
+__b43digits = {c: i for i, c in enumerate(__b43chars)}
 
 
 class BaseDecodeError(BitcoinException): pass
@@ -603,35 +606,23 @@ def base_decode(v: Union[bytes, str], *, base: int, length: int = None) -> Optio
     v = to_bytes(v, 'ascii')
     if base not in (58, 43):
         raise ValueError('not supported base: {}'.format(base))
-    chars = __b58chars
+    chars, digits = __b58chars, __b58digits
     if base == 43:
-        chars = __b43chars
+        chars, digits = __b43chars, __b43digits
     long_value = 0
-    power_of_base = 1
-    for c in v[::-1]:
-        digit = chars.find(bytes([c]))
-        if digit == -1:
-            raise BaseDecodeError('Forbidden character {} for base {}'.format(c, base))
-        # naive but slow variant:   long_value += digit * (base**i)
-        long_value += digit * power_of_base
-        power_of_base *= base
-    result = bytearray()
-    while long_value >= 256:
-        div, mod = divmod(long_value, 256)
-        result.append(mod)
-        long_value = div
-    result.append(long_value)
-    nPad = 0
     for c in v:
-        if c == chars[0]:
-            nPad += 1
-        else:
-            break
-    result.extend(b'\x00' * nPad)
+        digit = digits.get(c)
+        if digit is None:
+            raise BaseDecodeError('Forbidden character {} for base {}'.format(c, base))
+        # multiplying by the small base keeps the per-digit bignum work linear
+        long_value = long_value * base + digit
+    # at least one byte, even for a zero value
+    result = long_value.to_bytes(max(1, (long_value.bit_length() + 7) // 8), 'big')
+    nPad = len(v) - len(v.lstrip(chars[:1]))
+    result = bytes(nPad) + result
     if length is not None and len(result) != length:
         return None
-    result.reverse()
-    return bytes(result)
+    return result
 
 
 class InvalidChecksum(BaseDecodeError):
@@ -1,12 +1,15 @@
 import asyncio
+import re
 import time
 from abc import abstractmethod
 from enum import IntEnum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from PyQt5.QtGui import QPixmap, QKeySequence, QIcon, QCursor, QFont, QRegExpValidator
+from PyQt5.QtGui import (QPixmap, QKeySequence, QIcon, QCursor, QFont, QRegExpValidator,
+                         QStandardItemModel, QStandardItem)
 from PyQt5.QtCore import Qt, QRect, QStringListModel, QSize, pyqtSignal, QPoint
-from PyQt5.QtCore import QTimer, QRegExp
+from PyQt5.QtCore import QTimer, QRegExp, QSignalBlocker
 from PyQt5.QtWidgets import (QMessageBox, QComboBox, QSystemTrayIcon, QTabWidget,
                              QMenuBar, QFileDialog, QCheckBox, QLabel,
                              QVBoxLayout, QGridLayout, QLineEdit,
@@ -21,13 +24,102 @@ from electrum.gui.qt.amountedit import FreezableLineEdit
 from electrum.gui.qt.util import ComplexLineEdit, HelpLabel, EnterButton, ColorScheme, ChoicesLayout, HelpButton
 from electrum.i18n import _
 from electrum.logging import get_logger
-from electrum.evrmore import TOTAL_COIN_SUPPLY_LIMIT_IN_BTC, base_decode, base_encode, address_to_script, COIN
+from electrum.evrmore import TOTAL_COIN_SUPPLY_LIMIT_IN_BTC, base_decode, address_to_script, COIN
 from electrum.transaction import PartialTxOutput, AssetMeta
 from electrum.util import Satoshis, bfh, get_asyncio_loop
 
 
 _logger = get_logger(__name__)
 
+_MAX_SATS = TOTAL_COIN_SUPPLY_LIMIT_IN_BTC * COIN
+# Seconds an availability answer from the server is reused for the same name
+_AVAILABILITY_CACHE_TTL = 30
+
+_TXID_RE = re.compile('[0-9a-fA-F]{64}')
+_BASE58_RE = re.compile('[1-9A-HJ-NP-Za-km-z]+')
+# Any base58 string that decodes to exactly 34 bytes is 34 to 47 characters long
+_IPFS_MIN_CHARS = 34
+_IPFS_MAX_CHARS = 47
+
+# QRegExp needs no QApplication, so the field patterns are compiled once per process
+_RE_DIVISIONS = QRegExp('^[012345678]{1}$')
+_RE_AMOUNT_INT = QRegExp('^[1-9][0-9]{0,10}$')
+_RE_AMOUNT_BY_DIV = {
+    d: QRegExp('^[1-9][0-9]{1,10}$' if d == 0 else '^[0-9]{1,11}\\.([0-9]{1,' + str(d) + '})$')
+    for d in range(9)
+}
+# Reissuing may keep the divisions (but not lower them) and may add an amount of 0
+_RE_REISSUE_DIVISIONS = {d: QRegExp('^[' + '012345678'[d:] + ']{1}$') for d in range(8)}
+_RE_REISSUE_AMOUNT_BY_DIV = dict(_RE_AMOUNT_BY_DIV)
+_RE_REISSUE_AMOUNT_BY_DIV[0] = QRegExp('^[0-9]{1,11}$')
+
+
+def _amount_to_sats(text: str) -> int:
+    # Amount fields are regex-validated to digits with at most 8 decimals
+    whole, _, frac = text.partition('.')
+    return int(whole or 0) * COIN + int(frac[:8].ljust(8, '0'))
+
+
+def _restyle(widget: QWidget, ss: str):
+    # setStyleSheet re-polishes the widget even when the sheet is unchanged.
+    # (A QPalette would be cheaper, but the qdarkstyle app stylesheet overrides palette colors.)
+    if widget.styleSheet() != ss:
+        widget.setStyleSheet(ss)
+
+
+def _debounced(parent: QWidget, fn, ms=200) -> QTimer:
+    # Restart the returned timer on every keystroke; fn only runs once typing pauses.
+    # verify_valid still calls the checks directly, so nothing waits on the timer at submit.
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(ms)
+    timer.timeout.connect(fn)
+    return timer
+
+
+def _flush_check(timer: QTimer, fn):
+    # On Enter/focus-out, run a pending check now instead of waiting for the timer
+    if timer.isActive():
+        timer.stop()
+        fn()
+
+
+def _sync_owner_combo(combo: QComboBox, model: QStandardItemModel, options: List[str], disabled: Set[int]):
+    # Patch the existing items rather than clear() + addItems() and a setEnabled pass,
+    # which would tear down and recreate every item and then change most of them again
+    for i, option in enumerate(options):
+        enabled = i not in disabled
+        item = model.item(i)
+        if item is None:
+            item = QStandardItem(option)
+            item.setEnabled(enabled)
+            model.appendRow(item)
+            continue
+        if item.text() != option:
+            item.setText(option)
+        if item.isEnabled() != enabled:
+            item.setEnabled(enabled)
+    extra = model.rowCount() - len(options)
+    if extra > 0:
+        model.removeRows(len(options), extra)
+    # Rows may have shifted under the current selection
+    if combo.currentIndex() != 0:
+        combo.setCurrentIndex(0)
+
+
+@lru_cache(maxsize=256)
+def _b58_decode(text: str) -> bytes:
+    # base_decode is a quadratic pure-python loop and the same hashes are decoded over and over
+    # (every validation pass, get_output, each time a reissue asset is selected).
+    # Raises BaseDecodeError on a bad character; exceptions are not cached.
+    return base_decode(text, base=58)
+
+
+@lru_cache(maxsize=64)
+def _script_for_address(addr: str) -> bytes:
+    # Keyed on the address itself, so testnet/mainnet burn addresses never collide
+    return bfh(address_to_script(addr))
+
 
 class InterpretType(IntEnum):
     NO_DATA = 0
@@ -42,16 +134,22 @@ class AssetCreateWorkspace(QWidget):
 
         self.parent = parent
 
-        self.aval_owner_combo = QComboBox()
-        self.aval_owner_combo.setCurrentIndex(0)
-        self.aval_owner_combo.setVisible(False)
+        # ColorScheme is fixed once the gui is up; build the stylesheets once
+        self._ss_default = ColorScheme.DEFAULT.as_stylesheet()
+        self._ss_gray = ColorScheme.GRAY.as_stylesheet()
+        self._ss_green = ColorScheme.GREEN.as_stylesheet()
+        self._ss_red = ColorScheme.RED.as_stylesheet()
+
+        # Only needed for sub and unique assets; built on first use by _get_aval_owner_combo
+        self._aval_owner_combo = None  # type: Optional[QComboBox]
+        self._owner_indexes_in_mempool = set()  # type: Set[int]
 
-        c_grid = QGridLayout()
+        self._c_grid = c_grid = QGridLayout()
         c_grid.setSpacing(4)
 
         self.asset_name = ComplexLineEdit()
         self.asset_name.lineEdit.setMaxLength(30)
-        self.asset_name.setPrefixStyle(ColorScheme.GRAY.as_stylesheet())
+        self.asset_name.setPrefixStyle(self._ss_gray)
         self.asset_availability_text = QLabel()
         self.asset_availability_text.setAlignment(Qt.AlignCenter)
 
@@ -59,7 +157,21 @@ class AssetCreateWorkspace(QWidget):
         self.asset_amount = FreezableLineEdit()
         self.reissuable = QCheckBox()
 
-        self.cost_label = QLabel('Cost: {} EVR'.format(constants.net.BURN_AMOUNTS.IssueAssetBurnAmount))
+        # Divisions is a single digit, so every validator the fields can need is known up front
+        self._divisions_validator = QRegExpValidator(_RE_DIVISIONS, self)
+        self._int_amount_validator = QRegExpValidator(_RE_AMOUNT_INT, self)
+        self._amount_validators = {d: QRegExpValidator(r, self) for d, r in _RE_AMOUNT_BY_DIV.items()}
+
+        # Indexed by the selected asset type: Main, Sub, Unique
+        burn_amounts, burn_addresses = constants.net.BURN_AMOUNTS, constants.net.BURN_ADDRESSES
+        self._burn_info = [
+            (burn_addresses.IssueAssetBurnAddress, burn_amounts.IssueAssetBurnAmount),
+            (burn_addresses.IssueSubAssetBurnAddress, burn_amounts.IssueSubAssetBurnAmount),
+            (burn_addresses.IssueUniqueAssetBurnAddress, burn_amounts.IssueUniqueAssetBurnAmount),
+        ]
+        self._cost_labels = ['Cost: {} EVR'.format(amt) for _addr, amt in self._burn_info]
+
+        self.cost_label = QLabel(self._cost_labels[0])
 
         msg = _('Reissuability') + '\n\n' \
               + _('This lets the asset be edited in the future.')
@@ -70,15 +182,10 @@ class AssetCreateWorkspace(QWidget):
             self.divisions.setFrozen(False)
             self.asset_amount.setFrozen(False)
             i = clayout_obj.selected_index()
-            i2 = self.aval_owner_combo.currentIndex()
-            self.aval_owner_combo.setVisible(i != 0)
+            i2 = self._owner_index()
+            self._set_owner_combo_visible(i != 0)
 
-            if i == 0:
-                self.cost_label.setText('Cost: {} EVR'.format(constants.net.BURN_AMOUNTS.IssueAssetBurnAmount))
-            elif i == 1:
-                self.cost_label.setText('Cost: {} EVR'.format(constants.net.BURN_AMOUNTS.IssueSubAssetBurnAmount))
-            elif i == 2:
-                self.cost_label.setText('Cost: {} EVR'.format(constants.net.BURN_AMOUNTS.IssueUniqueAssetBurnAmount))
+            self.cost_label.setText(self._cost_labels[i])
 
             if i == 2:
                 self.divisions.setFrozen(True)
@@ -87,67 +194,43 @@ class AssetCreateWorkspace(QWidget):
                 self.asset_amount.setText('1')
                 self.reissuable.setCheckState(False)
                 self.reissuable.setEnabled(False)
-                self.reissue_label.setStyleSheet(ColorScheme.GRAY.as_stylesheet())
+                _restyle(self.reissue_label, self._ss_gray)
             else:
                 self.reissuable.setCheckState(True)
                 self.reissuable.setEnabled(True)
                 self.reissuable.setTristate(False)
-                self.reissue_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
-            if i == 0 or i2 == 0:
-                self.asset_name.lineEdit.setMaxLength(30)
-                self.asset_name.set_prefix('')
-                return
-            text = self.aval_owner_options[i2]
-            self.asset_name.lineEdit.setMaxLength(30 - len(text) - 1)
-            if i == 1:
-                self.asset_name.set_prefix(text + '/')
-            else:
-                self.asset_name.set_prefix(text + '#')
+                _restyle(self.reissue_label, self._ss_default)
+            self._apply_prefix_for(i, i2)
 
         create_asset_options = ['Main', 'Sub', 'Unique']
         self.create_options_layout = ChoicesLayout('Select an asset type', create_asset_options, on_type_click,
                                                    horizontal=True)
 
-        def on_combo_change():
-            self.asset_availability_text.setText('')
-            i = self.create_options_layout.selected_index()
-            i2 = self.aval_owner_combo.currentIndex()
-            self.aval_owner_combo.setVisible(i != 0)
-            if i == 0 or i2 == 0:
-                self.asset_name.set_prefix('')
-                self.asset_name.lineEdit.setMaxLength(30)
-                return
-            text = self.aval_owner_options[i2]
-            self.asset_name.lineEdit.setMaxLength(30 - len(text) - 1)
-            if i == 1:
-                self.asset_name.set_prefix(text + '/')
-            else:
-                self.asset_name.set_prefix(text + '#')
-
-        self.aval_owner_combo.currentIndexChanged.connect(on_combo_change)
-
         msg = _('The asset name.') + '\n\n' \
               + _(
             'This name must be unique.')
         name_label = HelpLabel(_('Asset Name'), msg)
         c_grid.addWidget(name_label, 2, 0)
-        c_grid.addWidget(self.aval_owner_combo, 2, 1)
         c_grid.addWidget(self.asset_name, 2, 2)
 
         self.asset_name_error_message = QLabel()
-        self.asset_name_error_message.setStyleSheet(ColorScheme.RED.as_stylesheet())
+        self.asset_name_error_message.setStyleSheet(self._ss_red)
         self.asset_name_error_message.setAlignment(Qt.AlignCenter)
 
         self.check_button = EnterButton(_("Check Availability"), self._check_availability)
         c_grid.addWidget(self.check_button, 2, 3)
 
-        self.asset_name.lineEdit.textChanged.connect(self._check_asset_name)
+        self._check_name_timer = _debounced(self, self._check_asset_name)
+        self.asset_name.lineEdit.textChanged.connect(self._on_asset_name_edited)
+        self.asset_name.lineEdit.editingFinished.connect(
+            lambda: _flush_check(self._check_name_timer, self._check_asset_name))
 
         c_grid.addWidget(self.asset_name_error_message, 3, 2)
         c_grid.addWidget(self.asset_availability_text, 3, 3)
 
+        # Labels and their editors sit in adjacent cells: divisions 0-1, reissuable 2-3, data 4-5
         c_grid_b = QGridLayout()
-        c_grid_b.setColumnStretch(2, 1)
+        c_grid_b.setColumnStretch(5, 1)
         c_grid_b.setHorizontalSpacing(10)
 
         def update_amount_line_edit():
@@ -168,42 +251,23 @@ class AssetCreateWorkspace(QWidget):
                 self.asset_amount.setText(split_amt[0])
 
             # Update regex
-            if divs == 0:
-                reg = QRegExp('^[1-9][0-9]{1,10}$')
-            else:
-                reg = QRegExp('^[0-9]{1,11}\\.([0-9]{1,' + str(divs) + '})$')
-            validator = QRegExpValidator(reg)
-            self.asset_amount.setValidator(validator)
+            self.asset_amount.setValidator(self._amount_validators[divs])
 
         msg = _('Asset Divisions') + '\n\n' \
               + _('Asset divisions are a number from 0 to 8. They dictate how much an asset can be divided. '
                   'The minimum asset amount is 10^-d where d is the division amount. Once an asset is issued, you cannot decrease this number.')
         divisions_label = HelpLabel(_('Divisions'), msg)
-        reg = QRegExp('^[012345678]{1}$')
-        validator = QRegExpValidator(reg)
-        self.divisions.setValidator(validator)
+        self.divisions.setValidator(self._divisions_validator)
         self.divisions.setFixedWidth(25)
         self.divisions.setText('0')
         self.divisions.textChanged.connect(update_amount_line_edit)
-        divisions_grid = QHBoxLayout()
-        divisions_grid.setSpacing(0)
-        divisions_grid.setContentsMargins(0, 0, 0, 0)
-        divisions_grid.addWidget(divisions_label)
-        divisions_grid.addWidget(self.divisions)
-        divisions_w = QWidget()
-        divisions_w.setLayout(divisions_grid)
-        c_grid_b.addWidget(divisions_w, 0, 0)
+        c_grid_b.addWidget(divisions_label, 0, 0)
+        c_grid_b.addWidget(self.divisions, 0, 1)
 
         self.reissuable.setCheckState(True)
         self.reissuable.setTristate(False)
-        reissue_grid = QHBoxLayout()
-        reissue_grid.setSpacing(0)
-        reissue_grid.setContentsMargins(0, 0, 0, 0)
-        reissue_grid.addWidget(self.reissue_label)
-        reissue_grid.addWidget(self.reissuable)
-        reissue_w = QWidget()
-        reissue_w.setLayout(reissue_grid)
-        c_grid_b.addWidget(reissue_w, 0, 1)
+        c_grid_b.addWidget(self.reissue_label, 0, 2)
+        c_grid_b.addWidget(self.reissuable, 0, 3)
 
         self.associated_data_info = QLabel()
         self.associated_data_info.setAlignment(Qt.AlignCenter)
@@ -215,17 +279,14 @@ class AssetCreateWorkspace(QWidget):
         data_label = HelpLabel(_('Associated Data'), msg)
         self.associated_data = QLineEdit()
 
-        self.associated_data.textChanged.connect(self._check_associated_data)
+        self._check_data_timer = _debounced(self, self._check_associated_data)
+        self.associated_data.textChanged.connect(lambda: self._check_data_timer.start())
+        self.associated_data.editingFinished.connect(
+            lambda: _flush_check(self._check_data_timer, self._check_associated_data))
 
-        data_grid = QHBoxLayout()
-        data_grid.setSpacing(0)
-        data_grid.setContentsMargins(0, 0, 0, 0)
-        data_grid.addWidget(data_label)
-        data_grid.addWidget(self.associated_data)
-        data_w = QWidget()
-        data_w.setLayout(data_grid)
-        c_grid_b.addWidget(data_w, 0, 2)
-        c_grid_b.addWidget(self.associated_data_info, 1, 2)
+        c_grid_b.addWidget(data_label, 0, 4)
+        c_grid_b.addWidget(self.associated_data, 0, 5)
+        c_grid_b.addWidget(self.associated_data_info, 1, 4, 1, 2)
 
         c_grid_c = QGridLayout()
         c_grid_c.setColumnStretch(4, 1)
@@ -234,23 +295,15 @@ class AssetCreateWorkspace(QWidget):
         msg = _('Asset Amount') + '\n\n' \
               + _('The amount of an asset to create')
         amount_label = HelpLabel(_('Amount'), msg)
-        reg = QRegExp('^[1-9][0-9]{0,10}$')
-        validator = QRegExpValidator(reg)
-        self.asset_amount.setValidator(validator)
-        amount_grid = QHBoxLayout()
-        amount_grid.setSpacing(0)
-        amount_grid.setContentsMargins(0, 0, 0, 0)
-        amount_grid.addWidget(amount_label)
-        amount_grid.addWidget(self.asset_amount)
-        amount_w = QWidget()
-        amount_w.setLayout(amount_grid)
-        c_grid_c.addWidget(amount_w, 0, 0)
+        self.asset_amount.setValidator(self._int_amount_validator)
+        c_grid_c.addWidget(amount_label, 0, 0)
+        c_grid_c.addWidget(self.asset_amount, 0, 1)
 
         self.asset_amount_warning = QLabel()
-        self.asset_amount_warning.setStyleSheet(ColorScheme.RED.as_stylesheet())
+        self.asset_amount_warning.setStyleSheet(self._ss_red)
 
         self.asset_amount.textChanged.connect(self._check_amount)
-        c_grid_c.addWidget(self.asset_amount_warning, 1, 0)
+        c_grid_c.addWidget(self.asset_amount_warning, 1, 0, 1, 2)
 
         bottom_buttons = QGridLayout()
         bottom_buttons.setColumnStretch(1, 2)
@@ -286,7 +339,59 @@ class AssetCreateWorkspace(QWidget):
 
         self.aval_owner_options = []  # type: List[str]
         self.last_checked = None  # type: Optional[str]
+        self._availability_cache = {}  # type: Dict[str, Tuple[float, Any]]
+        self._availability_pending = set()  # type: Set[str]
+
+    def _set_info(self, text: str, ss: str):
+        self.associated_data_info.setText(text)
+        _restyle(self.associated_data_info, ss)
+
+    def _get_aval_owner_combo(self) -> QComboBox:
+        if self._aval_owner_combo is None:
+            combo = self._aval_owner_combo = QComboBox()
+            self._populate_owner_combo()
+            combo.currentIndexChanged.connect(self._on_owner_combo_change)
+            self._c_grid.addWidget(combo, 2, 1)
+        return self._aval_owner_combo
+
+    def _set_owner_combo_visible(self, visible: bool):
+        if visible:
+            self._get_aval_owner_combo().setVisible(True)
+        elif self._aval_owner_combo is not None:
+            self._aval_owner_combo.setVisible(False)
+
+    def _owner_index(self) -> int:
+        # An unbuilt combo reads as 'Select a parent'
+        if self._aval_owner_combo is None:
+            return 0
+        return self._aval_owner_combo.currentIndex()
+
+    def _populate_owner_combo(self):
+        combo = self._aval_owner_combo
+        _sync_owner_combo(combo, combo.model(), self.aval_owner_options, self._owner_indexes_in_mempool)
+
+    def _on_owner_combo_change(self):
+        self.asset_availability_text.setText('')
+        i = self.create_options_layout.selected_index()
+        i2 = self._aval_owner_combo.currentIndex()
+        self._aval_owner_combo.setVisible(i != 0)
+        self._apply_prefix_for(i, i2)
+
+    def _apply_prefix_for(self, i: int, i2: int):
+        # i: selected asset type, i2: selected parent in the owner combo
+        options = self.aval_owner_options
+        if i == 0 or not 0 < i2 < len(options):
+            self.asset_name.lineEdit.setMaxLength(30)
+            self.asset_name.set_prefix('')
+            return
+        owner = options[i2]
+        self.asset_name.lineEdit.setMaxLength(30 - len(owner) - 1)
+        self.asset_name.set_prefix(owner + ('/' if i == 1 else '#'))
 
+    def _on_asset_name_edited(self):
+        # Any earlier availability result is stale as soon as the name changes
+        self.asset_availability_text.setText('')
+        self._check_name_timer.start()
 
     def _check_asset_name(self):
         self.asset_availability_text.setText('')
@@ -322,7 +427,7 @@ class AssetCreateWorkspace(QWidget):
             if len(asset) < 3:
                 self.asset_name_error_message.setText('Main assets must be more than 3 characters.')
                 return
-        elif self.aval_owner_combo.currentIndex() == 0:
+        elif self._owner_index() == 0:
             self.asset_name_error_message.setText('Please select a parent asset!')
             return
         if not self._check_asset_name():
@@ -335,33 +440,31 @@ class AssetCreateWorkspace(QWidget):
             self.associated_data_info.setText('')
             self.associated_data_interpret = InterpretType.NO_DATA
             return True
-        try:
-            if len(bytes.fromhex(text)) != 32:
-                raise Exception()
+        if _TXID_RE.fullmatch(text):
             self.associated_data_interpret = InterpretType.TXID
-            self.associated_data_info.setText('Reading as TXID')
-            self.associated_data_info.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
+            self._set_info('Reading as TXID', self._ss_default)
             return True
-        except Exception:
-            try:
-                self.associated_data_interpret = InterpretType.IPFS
-                raw = base_decode(text, base=58)
-                if len(raw) > 34:
-                    self.associated_data_info.setText('Too much data in IPFS hash!')
-                    self.associated_data_info.setStyleSheet(ColorScheme.RED.as_stylesheet())
-                    return False
-                elif len(raw) < 34:
-                    self.associated_data_info.setText('Too little data in IPFS hash!')
-                    self.associated_data_info.setStyleSheet(ColorScheme.RED.as_stylesheet())
-                    return False
-                else:
-                    self.associated_data_info.setText('Reading as IPFS')
-                    self.associated_data_info.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
-                    return True
-            except Exception:
-                self.associated_data_info.setText('Invalid IPFS hash!')
-                self.associated_data_info.setStyleSheet(ColorScheme.RED.as_stylesheet())
-                return False
+        self.associated_data_interpret = InterpretType.IPFS
+        # Reject on the cheap string checks first; base_decode is a pure-python bignum loop
+        if not _BASE58_RE.fullmatch(text):
+            error = 'Invalid IPFS hash!'
+        elif len(text) < _IPFS_MIN_CHARS:
+            error = 'Too little data in IPFS hash!'
+        elif len(text) > _IPFS_MAX_CHARS:
+            error = 'Too much data in IPFS hash!'
+        else:
+            raw = _b58_decode(text)
+            if len(raw) > 34:
+                error = 'Too much data in IPFS hash!'
+            elif len(raw) < 34:
+                error = 'Too little data in IPFS hash!'
+            else:
+                error = None
+        if error:
+            self._set_info(error, self._ss_red)
+            return False
+        self._set_info('Reading as IPFS', self._ss_default)
+        return True
 
     def _check_amount(self) -> bool:
         t = self.asset_amount.text()
@@ -375,12 +478,12 @@ class AssetCreateWorkspace(QWidget):
         except Exception:
             self.asset_amount_warning.setText('Invalid division amount')
             return False
-        v = float(t)
-        if v > TOTAL_COIN_SUPPLY_LIMIT_IN_BTC:
+        sats = _amount_to_sats(t)
+        if sats > _MAX_SATS:
             self.asset_amount_warning.setText(
                 _('More than the maximum amount ({})').format(TOTAL_COIN_SUPPLY_LIMIT_IN_BTC))
             return False
-        elif v == 0:
+        elif sats == 0:
             self.asset_amount_warning.setText(
                 _('The amount cannot be 0.')
             )
@@ -390,8 +493,19 @@ class AssetCreateWorkspace(QWidget):
             return True
 
     def check_asset_availability(self, asset):
+        cached = self._availability_cache.get(asset)
+        if cached and time.monotonic() - cached[0] < _AVAILABILITY_CACHE_TTL:
+            self.update_screen_based_on_asset_result(asset, cached[1])
+            return
+        if asset in self._availability_pending:
+            return
+        self._availability_pending.add(asset)
+
         def x(task: asyncio.Task):
-            self.update_screen_based_on_asset_result(asset, task.result())
+            self._availability_pending.discard(asset)
+            result = task.result()
+            self._availability_cache[asset] = (time.monotonic(), result)
+            self.update_screen_based_on_asset_result(asset, result)
         
         loop = get_asyncio_loop()
         task = loop.create_task(self.parent.network.get_meta_for_asset(asset))
@@ -401,45 +515,40 @@ class AssetCreateWorkspace(QWidget):
         if result:
             self.last_checked = None
             self.asset_availability_text.setText('Asset Unavailable')
-            self.asset_availability_text.setStyleSheet(ColorScheme.RED.as_stylesheet())
+            _restyle(self.asset_availability_text, self._ss_red)
         else:
             self.last_checked = asset
             self.asset_availability_text.setText('Asset Available')
-            self.asset_availability_text.setStyleSheet(ColorScheme.GREEN.as_stylesheet())
+            _restyle(self.asset_availability_text, self._ss_green)
 
     def refresh_owners(self):
         confirmed, unconfirmed, _ = self.parent.wallet.get_balance()
         owned_assets = confirmed.assets
-        in_mempool = self.parent.wallet.adb.get_assets_in_mempool()
-        owners = [n for n in owned_assets.keys() if
-                  n[-1] == '!' and owned_assets.get(n, 0) != 0]
+        # Same as adb.get_assets_in_mempool(), without a second pass over every coin
+        in_mempool = unconfirmed.assets.keys()
+        owners = sorted(n[:-1] for n, v in owned_assets.items() if v and n.endswith('!'))
+        new_aval_owner_options = ['Select a parent']
         indexes_in_mempool = set()
-        new_aval_owner_options = ['Select a parent'] + \
-                                  sorted([n[:-1] for n in owners])
-        for i in range(len(new_aval_owner_options)):
-            if i == 0:
-                continue
-            a = new_aval_owner_options[i]
+        for i, a in enumerate(owners, 1):
             if (a + '!') in in_mempool:
                 indexes_in_mempool.add(i)
-                new_aval_owner_options[i] = a + ' (Mempool)'
-
-        diff = set(new_aval_owner_options) - set(self.aval_owner_options)
+                a += ' (Mempool)'
+            new_aval_owner_options.append(a)
 
-        if self.aval_owner_options and not diff:
+        # Both lists are built sorted, so plain equality is enough (and also sees removals)
+        if new_aval_owner_options == self.aval_owner_options:
             return
 
         self.aval_owner_options = new_aval_owner_options
-        self.aval_owner_combo.clear()
-        self.aval_owner_combo.addItems(self.aval_owner_options)
-        for i in indexes_in_mempool:
-            self.aval_owner_combo.model().item(i).setEnabled(False)
+        self._owner_indexes_in_mempool = indexes_in_mempool
+        if self._aval_owner_combo is not None:
+            self._populate_owner_combo()
 
     def verify_valid(self) -> Optional[str]:
         asset = self.asset_name.get_prefix() + self.asset_name.text()
         if asset != self.last_checked:
             self.asset_availability_text.setText('Check if available')
-            self.asset_availability_text.setStyleSheet(ColorScheme.RED.as_stylesheet())
+            _restyle(self.asset_availability_text, self._ss_red)
             return 'Check if your asset is available first'
         if not self._check_amount():
             return 'Invalid amount'
@@ -447,7 +556,7 @@ class AssetCreateWorkspace(QWidget):
             if len(asset) < 3:
                 self.asset_name_error_message.setText('Main assets must be more than 3 characters.')
                 return 'Check name'
-        elif self.aval_owner_combo.currentIndex() == 0:
+        elif self._owner_index() == 0:
             self.asset_name_error_message.setText('Please select a parent asset!')
             return 'No parent asset'
         if not self._check_asset_name():
@@ -464,6 +573,14 @@ class AssetCreateWorkspace(QWidget):
         return False
 
     def reset_workspace(self):
+        # Every field is put back to a known-good state and its message cleared below,
+        # so the per-field change handlers (and their validators) have nothing to add
+        widgets = [self.asset_name.lineEdit, self.divisions, self.asset_amount, self.associated_data]
+        if self._aval_owner_combo is not None:
+            widgets.append(self._aval_owner_combo)
+        blockers = [QSignalBlocker(w) for w in widgets]
+        self._check_name_timer.stop()
+        self._check_data_timer.stop()
         self.create_options_layout.group.buttons()[0].setChecked(True)
         self.asset_name.lineEdit.setText('')
         self.asset_name.lineEdit.setMaxLength(30)
@@ -473,44 +590,35 @@ class AssetCreateWorkspace(QWidget):
         self.reissuable.setCheckState(True)
         self.reissuable.setEnabled(True)
         self.reissuable.setTristate(False)
-        self.aval_owner_combo.setVisible(False)
+        self._set_owner_combo_visible(False)
         self.asset_name_error_message.setText('')
         self.asset_availability_text.setText('')
         self.associated_data_info.setText('')
         self.asset_amount_warning.setText('')
         self.associated_data.setText('')
         self.asset_amount.setText('')
-        reg = QRegExp('^[1-9][0-9]{0,10}$')
-        validator = QRegExpValidator(reg)
-        self.asset_amount.setValidator(validator)
-        self.reissue_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
+        self.asset_amount.setValidator(self._int_amount_validator)
+        _restyle(self.reissue_label, self._ss_default)
         self.last_checked = None
         self.associated_data_interpret = InterpretType.NO_DATA
-        self.cost_label.setText('Cost: {} EVR'.format(constants.net.BURN_AMOUNTS.IssueAssetBurnAmount))
+        self.cost_label.setText(self._cost_labels[0])
         self.refresh_owners()
-        self.aval_owner_combo.setCurrentIndex(0)
+        if self._aval_owner_combo is not None:
+            self._aval_owner_combo.setCurrentIndex(0)
+        for b in blockers:
+            b.unblock()
 
     def get_owner(self):
-        i = self.aval_owner_combo.currentIndex()
+        i = self._owner_index()
         if i == 0:
             return None
         return self.aval_owner_options[i] + '!'
 
     def get_output(self):
         i = self.create_options_layout.selected_index()
-        if i == 0:
-            addr = constants.net.BURN_ADDRESSES.IssueAssetBurnAddress
-            amt = constants.net.BURN_AMOUNTS.IssueAssetBurnAmount
-        elif i == 1:
-            addr = constants.net.BURN_ADDRESSES.IssueSubAssetBurnAddress
-            amt = constants.net.BURN_AMOUNTS.IssueSubAssetBurnAmount
-        elif i == 2:
-            addr = constants.net.BURN_ADDRESSES.IssueUniqueAssetBurnAddress
-            amt = constants.net.BURN_AMOUNTS.IssueUniqueAssetBurnAmount
-        else:
-            NotImplementedError()
+        addr, amt = self._burn_info[i]
         burn = PartialTxOutput(
-            scriptpubkey=bfh(address_to_script(addr)),
+            scriptpubkey=_script_for_address(addr),
             value=Satoshis(amt * COIN)
         )
         norm = [burn]
@@ -524,17 +632,17 @@ class AssetCreateWorkspace(QWidget):
 
         asset = self.asset_name.get_prefix() + self.asset_name.text()
         is_unique = self.create_options_layout.selected_index() == 2
-        amt = int(float(self.asset_amount.text()) * COIN)
+        amt = _amount_to_sats(self.asset_amount.text())
         d = self.associated_data.text()  # type: str
 
         i = self.associated_data_interpret
         if i == InterpretType.NO_DATA:
             data = None
-        else:
-            if i == InterpretType.IPFS:
-                data = base_decode(d, base=58)
-            elif i == InterpretType.TXID:
-                data = b'\x54\x20' + bfh(d)
+        elif i == InterpretType.IPFS:
+            # already decoded by _check_associated_data: this is a cache hit
+            data = _b58_decode(d)
+        elif i == InterpretType.TXID:
+            data = b'\x54\x20' + bfh(d)
         new = [
             PartialTxOutput(
                 scriptpubkey=GENERATE_NEW_PLACEHOLDER(1, asset, amt, int(self.divisions.text()), 
@@ -556,14 +664,29 @@ class AssetCreateWorkspace(QWidget):
 
 
 class AssetReissueWorkspace(QWidget):
+    # (combo index, AssetMeta): meta queried from the server, delivered on the GUI thread
+    meta_received_signal = pyqtSignal(int, object)
+
     def __init__(self, parent, reissue_asset_callable):
         super().__init__()
 
         self.parent = parent
 
+        # ColorScheme is fixed once the gui is up; build the stylesheets once
+        self._ss_default = ColorScheme.DEFAULT.as_stylesheet()
+        self._ss_gray = ColorScheme.GRAY.as_stylesheet()
+        self._ss_red = ColorScheme.RED.as_stylesheet()
+        # Whether the field labels currently carry the DEFAULT (not GRAY) style
+        self._labels_default = False
+
         self.current_asset_meta = None
 
+        self._divisions_validators = {d: QRegExpValidator(r, self) for d, r in _RE_REISSUE_DIVISIONS.items()}
+        self._amount_validators = {d: QRegExpValidator(r, self) for d, r in _RE_REISSUE_AMOUNT_BY_DIV.items()}
+
         self.aval_owner_combo = QComboBox()
+        self._owner_model = QStandardItemModel()
+        self.aval_owner_combo.setModel(self._owner_model)
         self.aval_owner_combo.setCurrentIndex(0)
 
         self.divisions = FreezableLineEdit()
@@ -588,141 +711,45 @@ class AssetReissueWorkspace(QWidget):
             i = self.aval_owner_combo.currentIndex()
             if i == 0:
                 self.reset_gui()
-            else:
-                asset = self.aval_owner_options[i]
-                m = self.current_asset_meta = self.parent.wallet.adb.get_asset_meta(asset)
+                return
+            asset = self.aval_owner_options[i]
+            m = self.current_asset_meta = self.parent.wallet.adb.get_asset_meta(asset)
+            if m:
+                self._apply_meta_to_ui(m)
+                return
 
+            # Edge case where we have the ownership asset, but not the normal asset
+            async def async_data_get():
+                # We will trust what the server sends us, since this is just used for GUI and locking out
+                # invalid options which would be caught in a node broadcast
+                m = await self.parent.network.get_meta_for_asset(asset)
                 if not m:
-                    # Edge case where we have the ownership asset, but not the normal asset
-                    async def async_data_get():
-                        # We will trust what the server sends us, since this is just used for GUI and locking out
-                        # invalid options which would be caught in a node broadcast
-                        m = await self.parent.network.get_meta_for_asset(asset)
-                        if not m:
-                            # Dummy data
-                            _logger.warning("Couldn't query asset meta!")
-                            divs = 0
-                            reis = True
-                            data = None
-                            circulation = 0
-                        else:
-                            divs = m['divisions']
-                            reis = False if m['reissuable'] == 0 else True
-                            data = m.get('ipfs', None)
-                            circulation = m['sats_in_circulation']
-                        self.current_asset_meta = AssetMeta(asset, circulation, False, reis, divs, bool(data), data, -1, None, None, '', None, None, None)
-
-                        r = reis
-
-                        d = divs
-                        if d < 8:
-                            reg_base = '012345678'
-                            reg = QRegExp('^[' + reg_base[d:] + ']{1}$')
-                            validator = QRegExpValidator(reg)
-                            self.divisions.setValidator(validator)
-                            self.divisions.setFrozen(not r)
-
-                        self.divisions.setText(str(d))
-
-                        self.reissuable.setCheckState(r)
-                        if r:
-                            self.reissuable.setEnabled(r)
-                            self.reissuable.setTristate(False)
-
-                        i = data
-                        if i:
-                            self.associated_data.setFrozen(not r)
-                            raw_associated = base_decode(i, base=58)
-                            if raw_associated[:2] == b'\x54\x20':
-                                self.associated_data.setText(raw_associated[2:].hex())
-                            else:
-                                self.associated_data.setText(i)
-                            self._check_associated_data()
-                        else:
-                            self.associated_data.setFrozen(not r)
-                            self.associated_data.setText('')
-                            self._check_associated_data()
-
-                        self.asset_amount.setFrozen(not r)
-                        self.asset_amount.setText('0')
-                        self.current_sats.setText(
-                            _("({} {} currently in circulation)").format(Satoshis(circulation), asset))
-
-                        if d == 0:
-                            reg = QRegExp('^[0-9]{1,11}$')
-                        else:
-                            reg = QRegExp('^[0-9]{1,11}\\.([0-9]{1,' + str(d) + '})$')
-                        validator = QRegExpValidator(reg)
-                        self.asset_amount.setValidator(validator)
-
-                        if r:
-                            self.reissue_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
-                            self.divisions_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
-                            self.data_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
-                            self.amount_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
-
-                        self.exec_asset_b.setEnabled(r)
-
-                    loop = get_asyncio_loop()
-                    loop.create_task(async_data_get())
-                    return
-
-                r = m.is_reissuable
-
-                d = m.divisions
-                if d < 8:
-                    reg_base = '012345678'
-                    reg = QRegExp('^[' + reg_base[d:] + ']{1}$')
-                    validator = QRegExpValidator(reg)
-                    self.divisions.setValidator(validator)
-                    self.divisions.setFrozen(not r)
+                    # Dummy data
+                    _logger.warning("Couldn't query asset meta!")
+                    divs = 0
+                    reis = True
+                    data = None
+                    circulation = 0
                 else:
-                    self.divisions.setFrozen(True)
-
-                self.divisions.setText(str(d))
-
-                self.reissuable.setCheckState(r)
-                if r:
-                    self.reissuable.setEnabled(r)
-                    self.reissuable.setTristate(False)
-
-                i = m.ipfs_str
-                if i:
-                    self.associated_data.setFrozen(not r)
-                    raw_associated = base_decode(i, base=58)
-                    if raw_associated[:2] == b'\x54\x20':
-                        self.associated_data.setText(raw_associated[2:].hex())
-                    else:
-                        self.associated_data.setText(i)
-                            
-                    self._check_associated_data()
-                else:
-                    self.associated_data.setFrozen(not r)
-                    self.associated_data.setText('')
-                    self._check_associated_data()
-
-                self.asset_amount.setFrozen(not r)
-                self.asset_amount.setText('0')
-                self.current_sats.setText(_("({} {} currently in circulation)").format(Satoshis(m.circulation), m.name))
+                    divs = m['divisions']
+                    reis = False if m['reissuable'] == 0 else True
+                    data = m.get('ipfs', None)
+                    circulation = m['sats_in_circulation']
+                # this runs on the asyncio thread: hand the widgets over to the GUI thread
+                self.meta_received_signal.emit(i, AssetMeta(asset, circulation, False, reis, divs, bool(data), data, -1, None, None, '', None, None, None))
 
-                if d == 0:
-                    reg = QRegExp('^[0-9]{1,11}$')
-                else:
-                    reg = QRegExp('^[0-9]{1,11}\\.([0-9]{1,' + str(d) + '})$')
-                validator = QRegExpValidator(reg)
-                self.asset_amount.setValidator(validator)
-
-                if r:
-                    self.reissue_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
-                    self.divisions_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
-                    self.data_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
-                    self.amount_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
+            loop = get_asyncio_loop()
+            loop.create_task(async_data_get())
 
         self.aval_owner_combo.currentIndexChanged.connect(on_combo_change)
+        self.meta_received_signal.connect(self._on_meta_received)
 
-        c_grid_b = QGridLayout()
-        c_grid_b.setColumnStretch(2, 1)
-        c_grid_b.setHorizontalSpacing(10)
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(10)
+        grid.setColumnStretch(5, 1)
+
+        grid.addWidget(self.aval_owner_combo, 0, 0, 1, 6)
+        grid.addWidget(HelpButton("https://hans-schmidt.github.io/mastering_evrmore/current_tech_docs/evrmore_overview_of_assets.html"), 0, 6)
 
         msg = _('Asset Divisions') + '\n\n' \
               + _('Asset divisions are a number from 0 to 8. They dictate how much an asset can be divided. '
@@ -731,135 +758,140 @@ class AssetReissueWorkspace(QWidget):
         self.divisions.setText('')
         self.divisions.setFixedWidth(25)
         self.divisions.setFrozen(True)
-
-        divisions_grid = QHBoxLayout()
-        divisions_grid.setSpacing(0)
-        divisions_grid.setContentsMargins(0, 0, 0, 0)
-        divisions_grid.addWidget(self.divisions_label)
-        divisions_grid.addWidget(self.divisions)
-
-        divisions_w = QWidget()
-        divisions_w.setLayout(divisions_grid)
-        c_grid_b.addWidget(divisions_w, 0, 0)
+        grid.addWidget(self.divisions_label, 1, 0)
+        grid.addWidget(self.divisions, 1, 1)
 
         self.reissuable.setCheckState(True)
         self.reissuable.setEnabled(False)
-        reissue_grid = QHBoxLayout()
-        reissue_grid.setSpacing(0)
-        reissue_grid.setContentsMargins(0, 0, 0, 0)
-        reissue_grid.addWidget(self.reissue_label)
-        reissue_grid.addWidget(self.reissuable)
-        reissue_w = QWidget()
-        reissue_w.setLayout(reissue_grid)
-        c_grid_b.addWidget(reissue_w, 0, 1)
+        grid.addWidget(self.reissue_label, 1, 2)
+        grid.addWidget(self.reissuable, 1, 3)
 
         msg = _('Associated Data') + '\n\n' \
               + _('Data to associate with this asset.')
         self.data_label = HelpLabel(_('Associated Data'), msg)
         self.associated_data.setFrozen(True)
 
-        self.associated_data.textChanged.connect(self._check_associated_data)
+        self._check_data_timer = _debounced(self, self._check_associated_data)
+        self.associated_data.textChanged.connect(lambda: self._check_data_timer.start())
+        self.associated_data.editingFinished.connect(
+            lambda: _flush_check(self._check_data_timer, self._check_associated_data))
 
-        data_grid = QHBoxLayout()
-        data_grid.setSpacing(0)
-        data_grid.setContentsMargins(0, 0, 0, 0)
-        data_grid.addWidget(self.data_label)
-        data_grid.addWidget(self.associated_data)
-        data_w = QWidget()
-        data_w.setLayout(data_grid)
-        c_grid_b.addWidget(data_w, 0, 2)
-        c_grid_b.addWidget(self.associated_data_info, 1, 2)
-
-        c_grid_c = QGridLayout()
-        c_grid_c.setColumnStretch(4, 1)
-        c_grid_c.setHorizontalSpacing(10)
+        grid.addWidget(self.data_label, 1, 4)
+        grid.addWidget(self.associated_data, 1, 5, 1, 2)
+        grid.addWidget(self.associated_data_info, 2, 5, 1, 2)
 
         msg = _('Amount to Add') + '\n\n' \
               + _('The amount of an asset to add to circulation')
         self.amount_label = HelpLabel(_('Additional Amount'), msg)
-        amount_grid = QHBoxLayout()
-        amount_grid.setSpacing(0)
-        amount_grid.setContentsMargins(0, 0, 0, 0)
-        amount_grid.addWidget(self.amount_label)
-        amount_grid.addWidget(self.asset_amount)
-        amount_grid.addWidget(self.current_sats)
-        amount_w = QWidget()
-        amount_w.setLayout(amount_grid)
-        c_grid_c.addWidget(amount_w, 0, 0)
+        grid.addWidget(self.amount_label, 3, 0)
+        grid.addWidget(self.asset_amount, 3, 1, 1, 3)
+        grid.addWidget(self.current_sats, 3, 4, 1, 2)
 
         self.asset_amount_warning = QLabel()
-        self.asset_amount_warning.setStyleSheet(ColorScheme.RED.as_stylesheet())
+        self.asset_amount_warning.setStyleSheet(self._ss_red)
 
         self.asset_amount.textChanged.connect(self._check_amount)
-        c_grid_c.addWidget(self.asset_amount_warning, 1, 0)
-
-        bottom_buttons = QGridLayout()
-        bottom_buttons.setColumnStretch(1, 2)
+        grid.addWidget(self.asset_amount_warning, 4, 0, 1, 4)
 
         self.exec_asset_b = EnterButton(_("Reissue Asset"), reissue_asset_callable)
-        bottom_buttons.addWidget(self.exec_asset_b, 1, 0)
-        bottom_buttons.addWidget(self.cost_label, 1, 1)
+        grid.addWidget(self.exec_asset_b, 5, 0, 1, 2)
+        grid.addWidget(self.cost_label, 5, 2, 1, 3)
 
         def hard_reset():
             self.reset_workspace()
         self.reset_create_b = EnterButton(_("Reset"), hard_reset)
-        bottom_buttons.addWidget(self.reset_create_b, 1, 3)
-
-        top_layout = QHBoxLayout()
-        top_layout.addWidget(self.aval_owner_combo)
-        top_layout.addWidget(HelpButton("https://hans-schmidt.github.io/mastering_evrmore/current_tech_docs/evrmore_overview_of_assets.html"))
-        widgetA = QWidget()
-        widgetA.setLayout(top_layout)
-        widgetC = QWidget()
-        widgetC.setLayout(c_grid_b)
-        widgetD = QWidget()
-        widgetD.setLayout(c_grid_c)
-        widgetF = QWidget()
-        widgetF.setLayout(bottom_buttons)
-        create_l = QVBoxLayout()
-        create_l.addWidget(widgetA)
-        create_l.addWidget(widgetC)
-        create_l.addWidget(widgetD)
-        create_l.addWidget(widgetF)
-        self.setLayout(create_l)
+        grid.addWidget(self.reset_create_b, 5, 6)
+        grid.setRowStretch(6, 1)
+        self.setLayout(grid)
 
         self.aval_owner_options = []  # type: List[str]
 
 
+    def _on_meta_received(self, i: int, m: AssetMeta):
+        if self.aval_owner_combo.currentIndex() != i:
+            # Another selection was made while we were waiting
+            return
+        self.current_asset_meta = m
+        self._apply_meta_to_ui(m)
+
+    def _apply_meta_to_ui(self, m: AssetMeta):
+        r = m.is_reissuable
+        d = m.divisions
+        if d < 8:
+            self.divisions.setValidator(self._divisions_validators[d])
+            self.divisions.setFrozen(not r)
+        else:
+            self.divisions.setFrozen(True)
+        self.divisions.setText(str(d))
+
+        self.reissuable.setCheckState(r)
+        if r:
+            self.reissuable.setEnabled(r)
+            self.reissuable.setTristate(False)
+
+        i = m.ipfs_str
+        self.associated_data.setFrozen(not r)
+        # checked right below: don't also queue a debounced check
+        blocker = QSignalBlocker(self.associated_data)
+        if i:
+            raw_associated = _b58_decode(i)
+            if raw_associated[:2] == b'\x54\x20':
+                self.associated_data.setText(raw_associated[2:].hex())
+            else:
+                self.associated_data.setText(i)
+        else:
+            self.associated_data.setText('')
+        blocker.unblock()
+        self._check_data_timer.stop()
+        self._check_associated_data()
+
+        self.asset_amount.setFrozen(not r)
+        self.asset_amount.setText('0')
+        self.current_sats.setText(_("({} {} currently in circulation)").format(Satoshis(m.circulation), m.name))
+        self.asset_amount.setValidator(self._amount_validators[d])
+
+        if r and not self._labels_default:
+            for w in (self.reissue_label, self.divisions_label, self.data_label, self.amount_label):
+                w.setStyleSheet(self._ss_default)
+            self._labels_default = True
+
+        self.exec_asset_b.setEnabled(r)
+
+    def _set_info(self, text: str, ss: str):
+        self.associated_data_info.setText(text)
+        _restyle(self.associated_data_info, ss)
+
     def _check_associated_data(self) -> bool:
         text = self.associated_data.text()
         if len(text) == 0:
             self.associated_data_info.setText('')
             self.associated_data_interpret = InterpretType.NO_DATA
             return True
-            
-        try:
-            if len(bytes.fromhex(text)) != 32:
-                raise Exception()
+        if _TXID_RE.fullmatch(text):
             self.associated_data_interpret = InterpretType.TXID
-            self.associated_data_info.setText('Reading as TXID')
-            self.associated_data_info.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
+            self._set_info('Reading as TXID', self._ss_default)
             return True
-        except Exception:
-            try:
-                self.associated_data_interpret = InterpretType.IPFS
-                raw = base_decode(text, base=58)
-                if len(raw) > 34:
-                    self.associated_data_info.setText('Too much data in IPFS hash!')
-                    self.associated_data_info.setStyleSheet(ColorScheme.RED.as_stylesheet())
-                    return False
-                elif len(raw) < 34:
-                    self.associated_data_info.setText('Too little data in IPFS hash!')
-                    self.associated_data_info.setStyleSheet(ColorScheme.RED.as_stylesheet())
-                    return False
-                else:
-                    self.associated_data_info.setText('Reading as IPFS')
-                    self.associated_data_info.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
-                    return True
-            except Exception:
-                self.associated_data_info.setText('Invalid IPFS hash!')
-                self.associated_data_info.setStyleSheet(ColorScheme.RED.as_stylesheet())
-                return False
+        self.associated_data_interpret = InterpretType.IPFS
+        # Partially typed or overlong hashes are rejected on length alone, without decoding
+        if not _BASE58_RE.fullmatch(text):
+            error = 'Invalid IPFS hash!'
+        elif len(text) < _IPFS_MIN_CHARS:
+            error = 'Too little data in IPFS hash!'
+        elif len(text) > _IPFS_MAX_CHARS:
+            error = 'Too much data in IPFS hash!'
+        else:
+            raw = _b58_decode(text)
+            if len(raw) > 34:
+                error = 'Too much data in IPFS hash!'
+            elif len(raw) < 34:
+                error = 'Too little data in IPFS hash!'
+            else:
+                error = None
+        if error:
+            self._set_info(error, self._ss_red)
+            return False
+        self._set_info('Reading as IPFS', self._ss_default)
+        return True
 
     def _check_amount(self) -> bool:
         try:
@@ -873,8 +905,8 @@ class AssetReissueWorkspace(QWidget):
         if not t:
             self.asset_amount_warning.setText('')
             return True
-        v = float(t) + self.current_asset_meta.circulation / 100_000_000
-        if v > TOTAL_COIN_SUPPLY_LIMIT_IN_BTC:
+        sats = _amount_to_sats(t)
+        if sats + self.current_asset_meta.circulation > _MAX_SATS:
             self.asset_amount_warning.setText(
                 _('More than the maximum amount ({})').format(TOTAL_COIN_SUPPLY_LIMIT_IN_BTC))
             return False
@@ -885,40 +917,30 @@ class AssetReissueWorkspace(QWidget):
     def refresh_owners(self):
         confirmed, unconfirmed, _ = self.parent.wallet.get_balance()
         owned_assets = confirmed.assets
-        in_mempool = self.parent.wallet.adb.get_assets_in_mempool()
-
-        owners = [n for n in owned_assets.keys() if
-                  n[-1] == '!' and owned_assets.get(n, 0) != 0]
+        # Same as adb.get_assets_in_mempool(), without a second pass over every coin
+        in_mempool = unconfirmed.assets.keys()
 
-        new_aval_owner_options = ['Select an asset'] + \
-                                  sorted([n[:-1] for n in owners])
+        get_asset_meta = self.parent.wallet.adb.get_asset_meta
+        owners = sorted(n[:-1] for n, v in owned_assets.items() if v and n.endswith('!'))
+        new_aval_owner_options = ['Select an asset']
         disabled_indexes = set()
-        for i in range(len(new_aval_owner_options)):
-            if i == 0:
-                continue
-            asset = new_aval_owner_options[i]
-            meta = self.parent.wallet.adb.get_asset_meta(asset)  # type: AssetMeta
-            if not meta:
-                continue
-            else:
-                if not meta.is_reissuable:
-                    disabled_indexes.add(i)
-                    new_aval_owner_options[i] = asset + ' (Non-reissuable)'
-                if (asset + '!') in in_mempool:
-                    disabled_indexes.add(i)
-                    new_aval_owner_options[i] = asset + ' (Mempool)'
-
-        diff = set(new_aval_owner_options) - set(self.aval_owner_options)
-
-        if self.aval_owner_options and not diff:
+        for i, asset in enumerate(owners, 1):
+            meta = get_asset_meta(asset)  # type: AssetMeta
+            if meta and (asset + '!') in in_mempool:
+                disabled_indexes.add(i)
+                asset += ' (Mempool)'
+            elif meta and not meta.is_reissuable:
+                disabled_indexes.add(i)
+                asset += ' (Non-reissuable)'
+            new_aval_owner_options.append(asset)
+
+        # Labels encode the disabled state, so an equal list means nothing to redraw
+        # (this also catches removed owners, which a set difference would miss)
+        if new_aval_owner_options == self.aval_owner_options:
             return
 
         self.aval_owner_options = new_aval_owner_options
-        self.aval_owner_combo.clear()
-
-        self.aval_owner_combo.addItems(self.aval_owner_options)
-        for i in disabled_indexes:
-            self.aval_owner_combo.model().item(i).setEnabled(False)
+        _sync_owner_combo(self.aval_owner_combo, self._owner_model, new_aval_owner_options, disabled_indexes)
 
     def verify_valid(self) -> Optional[str]:
         if not self._check_amount():
@@ -946,6 +968,7 @@ class AssetReissueWorkspace(QWidget):
 
         self.associated_data.setFrozen(True)
         self.associated_data.setText('')
+        self._check_data_timer.stop()
         self.associated_data_info.setText('')
         self.associated_data_interpret = InterpretType.NO_DATA
 
@@ -954,10 +977,11 @@ class AssetReissueWorkspace(QWidget):
         self.current_sats.setText('')
         self.asset_amount_warning.setText('')
 
-        self.reissue_label.setStyleSheet(ColorScheme.GRAY.as_stylesheet())
-        self.divisions_label.setStyleSheet(ColorScheme.GRAY.as_stylesheet())
-        self.data_label.setStyleSheet(ColorScheme.GRAY.as_stylesheet())
-        self.amount_label.setStyleSheet(ColorScheme.GRAY.as_stylesheet())
+        self.reissue_label.setStyleSheet(self._ss_gray)
+        self.divisions_label.setStyleSheet(self._ss_gray)
+        self.data_label.setStyleSheet(self._ss_gray)
+        self.amount_label.setStyleSheet(self._ss_gray)
+        self._labels_default = False
 
     def reset_workspace(self):
         self.reset_gui()
@@ -972,10 +996,9 @@ class AssetReissueWorkspace(QWidget):
         return self.aval_owner_options[i] + '!'
 
     def get_output(self):
+        # PartialTxOutput is mutable, so only the script is shared between calls
         burn = PartialTxOutput(
-            scriptpubkey=bfh(address_to_script(
-                constants.net.BURN_ADDRESSES.ReissueAssetBurnAddress
-            )),
+            scriptpubkey=_script_for_address(constants.net.BURN_ADDRESSES.ReissueAssetBurnAddress),
             value=Satoshis(constants.net.BURN_AMOUNTS.ReissueAssetBurnAmount * COIN)
         )
         o = self.get_owner()
@@ -987,19 +1010,21 @@ class AssetReissueWorkspace(QWidget):
         norm = [burn, ownr]
 
         asset = o[:-1]
-        amt = int(float(self.asset_amount.text() or 0) * COIN)
-        d = self.associated_data.text()  # type: str
-
+        amt = _amount_to_sats(self.asset_amount.text() or '0')
+        d = self.associated_data.text()
         i = self.associated_data_interpret
         if i == InterpretType.NO_DATA:
             data = None
-        else:
-            if i == InterpretType.IPFS:
-                data = base_decode(d, base=58)
-            elif i == InterpretType.TXID:
-                data = b'\x54\x20' + bfh(d)
-
-        if data and base_encode(data, base=58) == self.current_asset_meta.ipfs_str:
+        elif i == InterpretType.IPFS:
+            # already decoded by _check_associated_data (via verify_valid): this is a cache hit
+            data = _b58_decode(d)
+        elif i == InterpretType.TXID:
+            data = b'\x54\x20' + bfh(d)
+
+        # Unchanged data is not rewritten; compare against the (memoized) decode of the
+        # current ipfs_str rather than base58-encoding ours on every submit
+        ipfs_str = self.current_asset_meta.ipfs_str
+        if data and ipfs_str and data == _b58_decode(ipfs_str):
             data = None
 
         divs = int(self.divisions.text())
@@ -28,11 +28,15 @@ import re
 import time
 import datetime
 from datetime import date
-from typing import TYPE_CHECKING, Tuple, Dict, Optional
+from typing import TYPE_CHECKING, Tuple, Dict, Optional, List
 import threading
+import itertools
+import math
 from enum import IntEnum
+from functools import lru_cache
 from decimal import Decimal
-from recordclass import RecordClass
+
+import attr
 
 from PyQt5.QtGui import QMouseEvent, QFont, QBrush, QColor
 from PyQt5.QtCore import (Qt, QPersistentModelIndex, QModelIndex, QAbstractItemModel,
@@ -52,7 +56,7 @@ from electrum.logging import get_logger, Logger
 from .custom_model import CustomNode, CustomModel
 from .util import (read_QIcon, MONOSPACE_FONT, Buttons, CancelButton, OkButton,
                    filename_field, MyTreeView, AcceptFileDragDrop, WindowModalDialog,
-                   CloseButton, webopen, WWLabel)
+                   CloseButton, webopen, WWLabel, WaitingDialog)
 
 if TYPE_CHECKING:
     from electrum.wallet import Abstract_Wallet
@@ -82,6 +86,26 @@ TX_ICONS = [
 
 ROLE_SORT_ORDER = Qt.UserRole + 1000
 
+# get_data_for_role hands these out for every painted cell; build them once
+_RED_BRUSH = QVariant(QBrush(QColor("#BC1E1E")))
+_BLUE_BRUSH = QVariant(QBrush(QColor("#1E1EFF")))
+_ALIGN_RIGHT_VCENTER = QVariant(int(Qt.AlignRight | Qt.AlignVCenter))
+_EMPTY_QVARIANT = QVariant()
+# what a status cell shows; DisplayRole also makes the proxy re-run the date filter
+_STATUS_ROLES = [Qt.DisplayRole, Qt.DecorationRole, Qt.ToolTipRole]
+
+
+@lru_cache(maxsize=1)
+def _monospace_font() -> QVariant:
+    # not at import time: fonts need the QApplication to exist
+    return QVariant(QFont(MONOSPACE_FONT))
+
+
+@lru_cache(maxsize=None)
+def _status_icon(icon: str) -> QVariant:
+    # only TX_ICONS and "lightning" ever get here
+    return QVariant(read_QIcon(icon))
+
 
 class HistoryColumns(IntEnum):
     STATUS = 0
@@ -95,50 +119,104 @@ class HistoryColumns(IntEnum):
     TXID = 8
 
 
+_FORMATTED_COLUMNS = frozenset((
+    HistoryColumns.AMOUNT,
+    HistoryColumns.BALANCE,
+    HistoryColumns.FIAT_VALUE,
+    HistoryColumns.FIAT_ACQ_PRICE,
+    HistoryColumns.FIAT_CAP_GAINS,
+))
+
+
+# tx_item fields that a new block can change without moving the tx or touching any other row
+_MINED_FIELDS = frozenset((
+    'height',
+    'confirmations',
+    'timestamp',
+    'monotonic_timestamp',
+    'txpos_in_block',
+    'date',
+))
+
+
+_TEXT_SORT_COLUMNS = frozenset((
+    HistoryColumns.DESCRIPTION,
+    HistoryColumns.ASSET,
+    HistoryColumns.TXID,
+))
+
+
+# HistoryNodeData field each column sorts by (STATUS and TXID are special-cased in get_sort_key)
+_SORT_FIELDS = {
+    HistoryColumns.DESCRIPTION: 'label',
+    HistoryColumns.ASSET: 'asset_name',
+    HistoryColumns.AMOUNT: 'amount',
+    HistoryColumns.BALANCE: 'balance',
+    HistoryColumns.FIAT_VALUE: 'fiat_value',
+    HistoryColumns.FIAT_ACQ_PRICE: 'acquisition_price',
+    HistoryColumns.FIAT_CAP_GAINS: 'fiat_gain',
+}
+
+
 class HistorySortModel(QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._date_range = None  # type: Optional[Tuple[datetime.datetime, datetime.datetime]]
+
+    def set_date_range(self, start_date: Optional[datetime.datetime], end_date: Optional[datetime.datetime]):
+        """Only accepts the txs dated within [start_date, end_date], unless either is None."""
+        self._date_range = (start_date, end_date) if start_date and end_date else None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex):
+        if self._date_range is None:
+            return True
+        node = self.sourceModel().index(source_row, 0, source_parent).internalPointer()
+        date = timestamp_to_datetime(node.get_data().timestamp)
+        if not date:
+            # unconfirmed
+            return True
+        start_date, end_date = self._date_range
+        return start_date <= date <= end_date
+
     def lessThan(self, source_left: QModelIndex, source_right: QModelIndex):
-        item1 = self.sourceModel().data(source_left, ROLE_SORT_ORDER)
-        item2 = self.sourceModel().data(source_right, ROLE_SORT_ORDER)
-        if item1 is None or item2 is None:
-            raise Exception(f'UserRole not set for column {source_left.column()}')
-        v1 = item1.value()
-        v2 = item2.value()
-        if v1 is None or isinstance(v1, Decimal) and v1.is_nan(): v1 = -float("inf")
-        if v2 is None or isinstance(v2, Decimal) and v2.is_nan(): v2 = -float("inf")
-        try:
-            return v1 < v2
-        except:
-            return False
+        # called O(n log n) times per sort: read the keys off the nodes directly,
+        # rather than going through data() and a QVariant for each side
+        col = source_left.column()
+        v1 = source_left.internalPointer().get_cmp_key(col, source_left.row())
+        v2 = source_right.internalPointer().get_cmp_key(col, source_right.row())
+        return v1 < v2
 
 
 def get_item_key(tx_item):
     return tx_item.txid if tx_item.txid else tx_item.payment_hash
 
 
-class HistoryNodeData(RecordClass):
-    lightning: bool
-    timestamp: Optional[int]
-    type: Optional[str]
-    txid: Optional[str]
-    confirmations: int
-    label: Optional[str]
-    asset_name: Optional[str]
-    amount: Satoshis
-    balance: Satoshis
-    fiat_value: Optional[Fiat]
-    fiat_default: bool
-    acquisition_price: Optional[Fiat]
-    fiat_gain: Optional[Fiat]
-    payment_hash: str
-    height: int
-    channel_id: Optional[str]
-    preimage: Optional[str]
-    fee: Optional[Satoshis]
-    fiat_currency: Optional[str]
-    fiat_rate: Optional[Fiat]
-    fiat_fee: Optional[Fiat]
-    capital_gain: Optional[Fiat]
-
+# slotted: the view reads these attributes for every cell it paints
+@attr.s(slots=True)
+class HistoryNodeData:
+    lightning = attr.ib(type=bool)
+    timestamp = attr.ib(type=Optional[int])
+    type = attr.ib(type=Optional[str])
+    txid = attr.ib(type=Optional[str])
+    confirmations = attr.ib(type=int)
+    label = attr.ib(type=Optional[str])
+    asset_name = attr.ib(type=Optional[str])
+    amount = attr.ib(type=Satoshis)
+    balance = attr.ib(type=Satoshis)
+    fiat_value = attr.ib(type=Optional[Fiat])
+    fiat_default = attr.ib(type=bool)
+    acquisition_price = attr.ib(type=Optional[Fiat])
+    fiat_gain = attr.ib(type=Optional[Fiat])
+    payment_hash = attr.ib(type=str)
+    height = attr.ib(type=int)
+    channel_id = attr.ib(type=Optional[str])
+    preimage = attr.ib(type=Optional[str])
+    fee = attr.ib(type=Optional[Satoshis])
+    fiat_currency = attr.ib(type=Optional[str])
+    fiat_rate = attr.ib(type=Optional[Fiat])
+    fiat_fee = attr.ib(type=Optional[Fiat])
+    capital_gain = attr.ib(type=Optional[Fiat])
 
 
 class HistoryNode(CustomNode):
@@ -146,115 +224,179 @@ class HistoryNode(CustomNode):
     def __init__(self, model, data):
         assert data is None or isinstance(data, HistoryNodeData)
         super().__init__(model, data)
+        # formatted amount/fiat cells by column, valid while the model's format_key() is unchanged
+        self._formatted = {}  # type: Dict[int, QVariant]
+        self._formatted_key = None
+        # get_cmp_key() results by column
+        self._cmp_keys = {}
+
+    def get_sort_key(self, col: int, row: int):
+        tx_item = self._data  # type: HistoryNodeData
+        if col == HistoryColumns.STATUS:
+            # respect sort order of self.transactions (wallet.get_full_history)
+            return -row
+        elif col == HistoryColumns.TXID:
+            return tx_item.txid if not tx_item.lightning else None
+        return getattr(tx_item, _SORT_FIELDS[col])
+
+    def get_cmp_key(self, col: int, row: int):
+        """get_sort_key() as a plain str or number, as compared by HistorySortModel:
+        text columns sort missing values as '', and the other columns sort
+        Satoshis/Fiat by their value, with anything missing or NaN first.
+        Each node is compared O(log n) times per sort, so the key is only normalised once."""
+        try:
+            return self._cmp_keys[col]
+        except KeyError:
+            pass
+        key = self.get_sort_key(col, row)
+        if col in _TEXT_SORT_COLUMNS:
+            key = key or ''
+        else:
+            if isinstance(key, (Satoshis, Fiat)):
+                key = key.value
+            if not isinstance(key, (int, float, Decimal)) or isinstance(key, Decimal) and key.is_nan():
+                key = -math.inf
+        self._cmp_keys[col] = key
+        return key
+
+    def invalidate_cache(self):
+        """To be called whenever the node's data is changed in place."""
+        self._formatted_key = None
+        self._cmp_keys.clear()
+
+    def _format_column(self, col: int, tx_item: 'HistoryNodeData') -> QVariant:
+        window = self.model.parent
+        if col == HistoryColumns.AMOUNT:
+            return QVariant(window.format_amount(tx_item.amount, is_diff=True, whitespaces=True))
+        elif col == HistoryColumns.BALANCE:
+            return QVariant(window.format_amount(tx_item.balance, whitespaces=True))
+        elif col == HistoryColumns.FIAT_VALUE and tx_item.fiat_value:
+            return QVariant(window.fx.format_fiat(tx_item.fiat_value.value))
+        elif col == HistoryColumns.FIAT_ACQ_PRICE and \
+                tx_item.amount < 0 and tx_item.acquisition_price:
+            # fixme: should use is_mine
+            return QVariant(window.fx.format_fiat(tx_item.acquisition_price.value))
+        elif col == HistoryColumns.FIAT_CAP_GAINS and tx_item.fiat_gain:
+            return QVariant(window.fx.format_fiat(tx_item.fiat_gain.value))
+        return _EMPTY_QVARIANT
 
     def get_data_for_role(self, index: QModelIndex, role: Qt.ItemDataRole) -> QVariant:
         # note: this method is performance-critical.
         # it is called a lot, and so must run extremely fast.
-        assert index.isValid()
-        col = index.column()
-        window = self.model.parent
-        tx_item = self.get_data()  # type: HistoryNodeData
-        is_lightning = tx_item.lightning
-        timestamp = tx_item.timestamp
-        if is_lightning:
-            status = 0
+        # (CustomModel.data() only calls it for valid indexes)
+        handler = _ROLE_HANDLERS.get(role)
+        if handler is None:
+            # Qt asks about many roles we have nothing for
+            return _EMPTY_QVARIANT
+        return handler(self, index)
+
+    def _get_status(self) -> Tuple[int, str]:
+        tx_item = self._data  # type: HistoryNodeData
+        if tx_item.lightning:
+            timestamp = tx_item.timestamp
             if timestamp is None:
-                status_str = 'unconfirmed'
-            else:
-                status_str = format_time(int(timestamp))
-        else:
-            tx_hash = tx_item.txid
-            conf = tx_item.confirmations
-            try:
-                status, status_str = self.model.tx_status_cache[tx_hash]
-            except KeyError:
-                tx_mined_info = self.model.tx_mined_info_from_tx_item(tx_item)
-                status, status_str = window.wallet.get_tx_status(tx_hash, tx_mined_info)
-
-        if role == ROLE_SORT_ORDER:
-            d = {
-                HistoryColumns.STATUS:
-                # respect sort order of self.transactions (wallet.get_full_history)
-                    -index.row(),
-                HistoryColumns.DESCRIPTION:
-                    tx_item.label,
-                HistoryColumns.ASSET:
-                    tx_item.asset_name,
-                HistoryColumns.AMOUNT:
-                    tx_item.amount,
-                HistoryColumns.BALANCE:
-                    tx_item.balance,
-                HistoryColumns.FIAT_VALUE:
-                    tx_item.fiat_value,
-                HistoryColumns.FIAT_ACQ_PRICE:
-                    tx_item.acquisition_price,
-                HistoryColumns.FIAT_CAP_GAINS:
-                    tx_item.fiat_gain,
-                HistoryColumns.TXID: tx_hash if not is_lightning else None,
-            }
-            return QVariant(d[col])
-        if role == MyTreeView.ROLE_EDIT_KEY:
-            return QVariant(get_item_key(tx_item))
-        if role not in (Qt.DisplayRole, Qt.EditRole):
-            if col == HistoryColumns.STATUS and role == Qt.DecorationRole:
-                icon = "lightning" if is_lightning else TX_ICONS[status]
-                return QVariant(read_QIcon(icon))
-            elif col == HistoryColumns.STATUS and role == Qt.ToolTipRole:
-                if is_lightning:
-                    msg = 'lightning transaction'
-                else:  # on-chain
-                    if tx_item.height == TX_HEIGHT_LOCAL:
-                        # note: should we also explain double-spends?
-                        msg = _("This transaction is only available on your local machine.\n"
-                                "The currently connected server does not know about it.\n"
-                                "You can either broadcast it now, or simply remove it.")
-                    else:
-                        msg = str(conf) + _(" confirmation" + ("s" if conf != 1 else ""))
-                return QVariant(msg)
-            elif col > HistoryColumns.DESCRIPTION and role == Qt.TextAlignmentRole:
-                return QVariant(int(Qt.AlignRight | Qt.AlignVCenter))
-            elif col > HistoryColumns.DESCRIPTION and role == Qt.FontRole:
-                monospace_font = QFont(MONOSPACE_FONT)
-                return QVariant(monospace_font)
-            # elif col == HistoryColumns.DESCRIPTION and role == Qt.DecorationRole and not is_lightning\
-            #        and self.parent.wallet.invoices.paid.get(tx_hash):
-            #    return QVariant(read_QIcon("seal"))
-            elif col in (HistoryColumns.DESCRIPTION, HistoryColumns.AMOUNT) \
-                    and role == Qt.ForegroundRole and tx_item.amount < 0:
-                red_brush = QBrush(QColor("#BC1E1E"))
-                return QVariant(red_brush)
-            elif col == HistoryColumns.FIAT_VALUE and role == Qt.ForegroundRole \
-                    and not tx_item.fiat_default and tx_item.fiat_value is not None:
-                blue_brush = QBrush(QColor("#1E1EFF"))
-                return QVariant(blue_brush)
-            return QVariant()
+                return 0, 'unconfirmed'
+            return 0, format_time(int(timestamp))
+        tx_hash = tx_item.txid
+        status_info = self.model.tx_status_cache.get(tx_hash)
+        if status_info is None:
+            # refresh() only fills in the unconfirmed txs, confirmed ones get here on their first paint
+            tx_mined_info = self.model.tx_mined_info_from_tx_item(tx_item)
+            status_info = self.model.parent.wallet.get_tx_status(tx_hash, tx_mined_info)
+            self.model.tx_status_cache[tx_hash] = status_info
+        return status_info
+
+    def _sort_order_data(self, index: QModelIndex) -> QVariant:
+        return QVariant(self.get_sort_key(index.column(), index.row()))
+
+    def _edit_key_data(self, index: QModelIndex) -> QVariant:
+        return QVariant(get_item_key(self._data))
+
+    def _display_data(self, index: QModelIndex) -> QVariant:
+        return self.get_display_data(index.column())
+
+    def get_display_data(self, col: int) -> QVariant:
+        tx_item = self._data  # type: HistoryNodeData
         if col == HistoryColumns.STATUS:
-            return QVariant(status_str)
+            return QVariant(self._get_status()[1])
         elif col == HistoryColumns.DESCRIPTION and tx_item.label:
             return QVariant(tx_item.label)
         elif col == HistoryColumns.ASSET and tx_item.asset_name:
             return QVariant(tx_item.asset_name)
-        elif col == HistoryColumns.AMOUNT:
-            v_str = window.format_amount(tx_item.amount, is_diff=True, whitespaces=True)
-            return QVariant(v_str)
-        elif col == HistoryColumns.BALANCE:
-            balance_str = window.format_amount(tx_item.balance, whitespaces=True)
-            return QVariant(balance_str)
-        elif col == HistoryColumns.FIAT_VALUE and tx_item.fiat_value:
-            value_str = window.fx.format_fiat(tx_item.fiat_value.value)
-            return QVariant(value_str)
-        elif col == HistoryColumns.FIAT_ACQ_PRICE and \
-                tx_item.amount < 0 and tx_item.acquisition_price:
-            # fixme: should use is_mine
-            acq = tx_item.acquisition_price.value
-            return QVariant(window.fx.format_fiat(acq))
-        elif col == HistoryColumns.FIAT_CAP_GAINS and tx_item.fiat_gain:
-            cg = tx_item.fiat_gain.value
-            return QVariant(window.fx.format_fiat(cg))
+        elif col in _FORMATTED_COLUMNS:
+            # the view asks for the same cell over and over; format it once per unit/currency setting
+            key = self.model.format_key()
+            if key != self._formatted_key:
+                self._formatted.clear()
+                self._formatted_key = key
+            v = self._formatted.get(col)
+            if v is None:
+                v = self._formatted[col] = self._format_column(col, tx_item)
+            return v
         elif col == HistoryColumns.TXID:
-            return QVariant(tx_hash) if not is_lightning else QVariant('')
+            return QVariant(tx_item.txid) if not tx_item.lightning else QVariant('')
         return QVariant()
 
+    def _decoration_data(self, index: QModelIndex) -> QVariant:
+        if index.column() == HistoryColumns.STATUS:
+            icon = "lightning" if self._data.lightning else TX_ICONS[self._get_status()[0]]
+            return _status_icon(icon)
+        # elif col == HistoryColumns.DESCRIPTION and not is_lightning\
+        #        and self.parent.wallet.invoices.paid.get(tx_hash):
+        #    return QVariant(read_QIcon("seal"))
+        return _EMPTY_QVARIANT
+
+    def _tooltip_data(self, index: QModelIndex) -> QVariant:
+        if index.column() != HistoryColumns.STATUS:
+            return _EMPTY_QVARIANT
+        tx_item = self._data  # type: HistoryNodeData
+        if tx_item.lightning:
+            msg = 'lightning transaction'
+        else:  # on-chain
+            if tx_item.height == TX_HEIGHT_LOCAL:
+                # note: should we also explain double-spends?
+                msg = _("This transaction is only available on your local machine.\n"
+                        "The currently connected server does not know about it.\n"
+                        "You can either broadcast it now, or simply remove it.")
+            else:
+                conf = tx_item.confirmations
+                msg = str(conf) + _(" confirmation" + ("s" if conf != 1 else ""))
+        return QVariant(msg)
+
+    def _alignment_data(self, index: QModelIndex) -> QVariant:
+        if index.column() > HistoryColumns.DESCRIPTION:
+            return _ALIGN_RIGHT_VCENTER
+        return _EMPTY_QVARIANT
+
+    def _font_data(self, index: QModelIndex) -> QVariant:
+        if index.column() > HistoryColumns.DESCRIPTION:
+            return _monospace_font()
+        return _EMPTY_QVARIANT
+
+    def _foreground_data(self, index: QModelIndex) -> QVariant:
+        col = index.column()
+        tx_item = self._data  # type: HistoryNodeData
+        if col in (HistoryColumns.DESCRIPTION, HistoryColumns.AMOUNT) and tx_item.amount < 0:
+            return _RED_BRUSH
+        elif col == HistoryColumns.FIAT_VALUE \
+                and not tx_item.fiat_default and tx_item.fiat_value is not None:
+            return _BLUE_BRUSH
+        return _EMPTY_QVARIANT
+
+
+# role -> HistoryNode method answering it; every other role gets an empty QVariant
+_ROLE_HANDLERS = {
+    ROLE_SORT_ORDER: HistoryNode._sort_order_data,
+    MyTreeView.ROLE_EDIT_KEY: HistoryNode._edit_key_data,
+    Qt.DisplayRole: HistoryNode._display_data,
+    Qt.EditRole: HistoryNode._display_data,
+    Qt.DecorationRole: HistoryNode._decoration_data,
+    Qt.ToolTipRole: HistoryNode._tooltip_data,
+    Qt.TextAlignmentRole: HistoryNode._alignment_data,
+    Qt.FontRole: HistoryNode._font_data,
+    Qt.ForegroundRole: HistoryNode._foreground_data,
+}
+
 
 class HistoryModel(CustomModel, Logger):
 
@@ -265,15 +407,30 @@ class HistoryModel(CustomModel, Logger):
         self.view = None  # type: HistoryList
         self.transactions = OrderedDictWithIndex()
         self.tx_status_cache = {}  # type: Dict[str, Tuple[int, str]]
+        # mined info of the on-chain txs that on_fee_histogram needs to revisit
+        self.unconfirmed_txs = {}  # type: Dict[str, TxMinedInfo]
+        self._column_visibility = None  # (show_history, capital_gains) last applied to the view
+        self._tx_rows = {}  # type: Dict[str, List[int]]  # tx key -> its top-level rows
+        self._headers = None  # type: Optional[Dict[int, str]]
+
+    def format_key(self) -> tuple:
+        """Everything the cached amount/fiat cell strings depend on, besides the row itself."""
+        config = self.parent.config
+        fx = self.parent.fx
+        return (config.decimal_point, config.num_zeros, config.amt_precision_post_satoshi,
+                config.amt_add_thousands_sep, fx.ccy if fx else None)
 
     def set_view(self, history_list: 'HistoryList'):
         # FIXME HistoryModel and HistoryList mutually depend on each other.
         # After constructing both, this method needs to be called.
         self.view = history_list  # type: HistoryList
+        self._column_visibility = None
         self.set_visibility_of_columns()
 
     def update_label(self, index):
-        tx_item = index.internalPointer().get_data()
+        node = index.internalPointer()
+        node.invalidate_cache()
+        tx_item = node.get_data()
         tx_item.label = self.parent.wallet.get_label_for_txid(get_item_key(tx_item))
         topLeft = bottomRight = self.createIndex(index.row(), HistoryColumns.DESCRIPTION)
         self.dataChanged.emit(topLeft, bottomRight, [Qt.DisplayRole])
@@ -287,45 +444,213 @@ class HistoryModel(CustomModel, Logger):
         """Overridden in address_dialog.py"""
         return True
 
+    def add_top_level_node(self, node: HistoryNode):
+        self._root.addChild(node)
+        self._tx_rows.setdefault(get_item_key(node.get_data()), []).append(node.row())
+
+    def emit_status_changed(self, tx_keys):
+        """Emits dataChanged for the status cells of the given txs, one signal per run of adjacent rows.
+        A change of mined status only shows in the STATUS column (text, icon and tooltip)."""
+        rows = sorted(row for key in tx_keys for row in self._tx_rows.get(key, ()))
+        col = HistoryColumns.STATUS
+        for _key, run in itertools.groupby(enumerate(rows), key=lambda x: x[1] - x[0]):
+            run = list(run)
+            first, last = run[0][1], run[-1][1]
+            self.dataChanged.emit(self.createIndex(first, col, self._root.child(first)),
+                                  self.createIndex(last, col, self._root.child(last)),
+                                  _STATUS_ROLES)
+
     def add_history_node(self, node_data: HistoryNodeData, parents, tx_item):
         node = HistoryNode(self, node_data)
         group_id = tx_item.get('group_id')
         if group_id is None:
-            self._root.addChild(node)
+            self.add_top_level_node(node)
         else:
-            parent = parents.get(group_id)
+            # rows only add up within the same asset, so each asset gets its own group
+            group_key = (group_id, node_data.asset_name)
+            parent = parents.get(group_key)
             if parent is None:
                 # create parent if it does not exist
-                self._root.addChild(node)
-                parents[group_id] = node
+                self.add_top_level_node(node)
+                parents[group_key] = node
             else:
+                parent_data = parent.get_data()  # type: HistoryNodeData
                 # if parent has no children, create two children
                 if parent.childCount() == 0:
-                    child_data = dict(parent.get_data())
-                    node1 = HistoryNode(self, child_data)
-                    parent.addChild(node1)
-                    parent._data['label'] = child_data.get('group_label')
-                    parent._data['bc_value'] = child_data.get('bc_value', EvrmoreValue())
-                    parent._data['ln_value'] = child_data.get('ln_value', EvrmoreValue())
+                    parent.addChild(HistoryNode(self, attr.evolve(parent_data)))
                 # add child to parent
                 parent.addChild(node)
                 # update parent data
-                parent._data['balance'] = tx_item['balance']
-                parent._data['value'] += tx_item['value']
+                # (the amounts can be shared with the wallet's history items: add, don't mutate)
+                parent_data.balance = node_data.balance
+                parent_data.amount += node_data.amount
+                if parent_data.fiat_value is not None and node_data.fiat_value is not None:
+                    parent_data.fiat_value += node_data.fiat_value
                 if 'group_label' in tx_item:
-                    parent._data['label'] = tx_item['group_label']
-                if 'bc_value' in tx_item:
-                    parent._data['bc_value'] += tx_item['bc_value']
-                if 'ln_value' in tx_item:
-                    parent._data['ln_value'] += tx_item['ln_value']
-                if 'fiat_value' in tx_item:
-                    parent._data['fiat_value'] += tx_item['fiat_value']
+                    parent_data.label = tx_item['group_label']
                 if tx_item.get('txid') == group_id:
-                    parent._data['lightning'] = False
-                    parent._data['txid'] = tx_item['txid']
-                    parent._data['timestamp'] = tx_item['timestamp']
-                    parent._data['height'] = tx_item['height']
-                    parent._data['confirmations'] = tx_item['confirmations']
+                    parent_data.lightning = False
+                    parent_data.txid = node_data.txid
+                    parent_data.timestamp = node_data.timestamp
+                    parent_data.height = node_data.height
+                    parent_data.confirmations = node_data.confirmations
+                parent.invalidate_cache()
+
+    def make_asset_filter(self):
+        """Returns should_show(asset) for one refresh.
+        The spam lists are compiled once, and each asset is only checked once,
+        however many transactions it appears in."""
+        if self.parent.config.get('show_spam_assets', False):
+            blacklist = whitelist = []
+        else:
+            blacklist = [re.compile(regex) for regex in self.parent.asset_blacklist]
+            whitelist = [re.compile(regex) for regex in self.parent.asset_whitelist]
+        results = {}  # type: Dict[str, bool]
+
+        def should_show(asset):
+            if not asset:
+                return True
+            show = results.get(asset)
+            if show is None:
+                # the whitelist overrides the blacklist
+                show = not any(r.search(asset) for r in blacklist) or any(r.search(asset) for r in whitelist)
+                results[asset] = show
+            return show
+        return should_show
+
+    def add_tx_nodes(self, tx_item, parents, should_show):
+        """Adds the rows of one transaction: one for its EVR amount, and one per asset it moved."""
+        g = tx_item.get
+        value = tx_item['value']  # type: EvrmoreValue
+        # EvrmoreValue.assets returns a copy, so take it once per transaction
+        balances = tx_item['balance'].assets
+        lightning = g('lightning', False)
+        timestamp = g('timestamp')
+        type = g('type')
+        txid = g('txid')
+        confirmations = g('confirmations', 0)
+        label = g('label')
+        payment_hash = g('payment_hash')
+        height = g('height')
+        channel_id = g('channel_id')
+        preimage = g('preimage')
+        fee = g('fee')
+
+        if value.evr_value != 0:
+            capital_gain = g('capital_gain')
+            node_data = HistoryNodeData(
+                lightning, timestamp, type, txid, confirmations, label,
+                'EVR', value.evr_value, tx_item['balance'].evr_value,
+                g('fiat_value'), g('fiat_default', False), g('acquisition_price'), capital_gain,
+                payment_hash, height, channel_id, preimage, fee,
+                g('fiat_currency'), g('fiat_rate'), g('fiat_fee'), capital_gain)
+            self.add_history_node(node_data, parents, tx_item)
+
+        for asset, amount in value.assets.items():
+
+            if not should_show(asset):
+                continue
+
+            node_data = HistoryNodeData(
+                lightning, timestamp, type, txid, confirmations, label,
+                asset, amount, balances[asset],
+                None, None, None, None,
+                payment_hash, height, channel_id, preimage, fee,
+                None, None, None, None)
+            self.add_history_node(node_data, parents, tx_item)
+
+    def update_incrementally(self, transactions) -> bool:
+        """Patches the existing rows instead of rebuilding the tree, for the common updates:
+        new blocks (only the mined info of some txs changed) and new txs at the end of the history.
+        Returns False if refresh() has to rebuild instead."""
+        old = self.transactions
+        if not old or len(transactions) < len(old):
+            return False
+        changed = {}  # key -> tx_item, for the txs whose mined info changed
+        new_items = iter(transactions.items())
+        # (zip stops at the end of old without taking anything more from new_items)
+        for (old_key, old_item), (key, tx_item) in zip(old.items(), new_items):
+            if key != old_key:
+                return False
+            if tx_item == old_item:
+                continue
+            if tx_item.get('group_id') is not None or old_item.get('group_id') is not None:
+                # grouped rows aggregate several txs into their parent row
+                return False
+            for k in tx_item.keys() | old_item.keys():
+                if k not in _MINED_FIELDS and tx_item.get(k) != old_item.get(k):
+                    return False
+            changed[key] = tx_item
+        added = list(new_items)
+        if any(tx_item.get('group_id') is not None for key, tx_item in added):
+            return False
+
+        for key, tx_item in itertools.chain(changed.items(), added):
+            if tx_item.get('lightning', False):
+                continue
+            if tx_item['confirmations'] <= 0:
+                self.set_tx_status(key, self.tx_mined_info_from_tx_item(tx_item))
+            else:
+                # recomputed on the next paint, as in refresh()
+                self.tx_status_cache.pop(key, None)
+                self.unconfirmed_txs.pop(key, None)
+        for key, tx_item in changed.items():
+            for row in self._tx_rows.get(key, ()):
+                node_data = self._root.child(row).get_data()  # type: HistoryNodeData
+                node_data.height = tx_item.get('height')
+                node_data.confirmations = tx_item.get('confirmations', 0)
+                node_data.timestamp = tx_item.get('timestamp')
+        self.emit_status_changed(changed)
+        first_new = self._root.childCount()
+        parents = {}
+        should_show = self.make_asset_filter()
+        for key, tx_item in added:
+            self.add_tx_nodes(tx_item, parents, should_show)
+        last_new = self._root.childCount() - 1
+        if last_new >= first_new:
+            self.beginInsertRows(QModelIndex(), first_new, last_new)
+            self.transactions = transactions
+            self.endInsertRows()
+        else:
+            self.transactions = transactions
+        return True
+
+    def _rebuild(self, transactions):
+        wallet = self.parent.wallet
+        old_length = self._root.childCount()
+        if old_length != 0:
+            self.beginRemoveRows(QModelIndex(), 0, old_length)
+            self.transactions.clear()
+            self._root = HistoryNode(self, None)
+            self._tx_rows.clear()
+            self.endRemoveRows()
+        parents = {}
+
+        should_show = self.make_asset_filter()
+
+        for tx_item in transactions.values():
+            self.add_tx_nodes(tx_item, parents, should_show)
+
+        # update tx_status_cache
+        # (before inserting the rows: endInsertRows() makes the view paint them straight away)
+        # built aside and swapped in, so readers never see it half-filled.
+        # Only unconfirmed txs are computed up front: their status needs the tx, its fee and the mempool.
+        # A confirmed tx is just a clock icon and its date, filled in by HistoryNode._get_status
+        # the first time its row is painted, so a refresh does not format dates for rows nobody scrolls to.
+        tx_status_cache = {}
+        unconfirmed_txs = {}
+        for txid, tx_item in transactions.items():
+            if not tx_item.get('lightning', False) and tx_item['confirmations'] <= 0:
+                tx_mined_info = self.tx_mined_info_from_tx_item(tx_item)
+                tx_status_cache[txid] = wallet.get_tx_status(txid, tx_mined_info)
+                unconfirmed_txs[txid] = tx_mined_info
+        self.tx_status_cache = tx_status_cache
+        self.unconfirmed_txs = unconfirmed_txs
+
+        new_length = self._root.childCount()
+        self.beginInsertRows(QModelIndex(), 0, new_length - 1)
+        self.transactions = transactions
+        self.endInsertRows()
 
     @profiler
     def refresh(self, reason: str, force=False):
@@ -348,125 +673,15 @@ class HistoryModel(CustomModel, Logger):
             include_lightning=self.should_include_lightning_payments())
         if not force and transactions == self.transactions:
             return
-        old_length = self._root.childCount()
-        if old_length != 0:
-            self.beginRemoveRows(QModelIndex(), 0, old_length)
-            self.transactions.clear()
-            self._root = HistoryNode(self, None)
-            self.endRemoveRows()
-        parents = {}
-
-        def should_show(asset):
-            if not asset:
-                return True
-            should_show = True
-            if not self.parent.config.get('show_spam_assets', False):
-                for regex in self.parent.asset_blacklist:
-                    if re.search(regex, asset):
-                        should_show = False
-                        break
-
-                for regex in self.parent.asset_whitelist:
-                    if re.search(regex, asset):
-                        should_show = True
-                        break
-
-            return should_show
-
-        for tx_item in transactions.values():
-
-            # Create separate rows for assets
-
-            value = tx_item['value']  # type: EvrmoreValue
-            lightning = tx_item.get('lightning', False)
-            timestamp = tx_item.get('timestamp')
-            txid = tx_item.get('txid')
-            confirmations = tx_item.get('confirmations', 0)
-            label = tx_item.get('label')
-            fiat_value = tx_item.get('fiat_value')
-            fiat_default = tx_item.get('fiat_default', False)
-            acqu_price = tx_item.get('acquisition_price')
-            fiat_gain = tx_item.get('capital_gain')
-            payment_hash = tx_item.get('payment_hash')
-            height = tx_item.get('height')
-            type = tx_item.get('type')
-            channel_id = tx_item.get('channel_id')
-            preimage = tx_item.get('preimage')
-            fee = tx_item.get('fee')
-            fiat_currency = tx_item.get('fiat_currency'),
-            fiat_rate = tx_item.get('fiat_rate'),
-            fiat_fee = tx_item.get('fiat_fee'),
-            capital_gain = tx_item.get('capital_gain')
-
-            if value.evr_value != 0:
-                asset_name = 'EVR'
-                amount = value.evr_value
-                balance = tx_item['balance'].evr_value
-                node_data = HistoryNodeData(
-                    lightning=lightning,
-                    timestamp=timestamp,
-                    txid=txid,
-                    confirmations=confirmations,
-                    label=label,
-                    asset_name=asset_name,
-                    amount=amount,
-                    balance=balance,
-                    fiat_value=fiat_value,
-                    fiat_default=fiat_default,
-                    acquisition_price=acqu_price,
-                    fiat_gain=fiat_gain,
-                    payment_hash=payment_hash,
-                    height=height,
-                    type=type,
-                    channel_id=channel_id,
-                    preimage=preimage,
-                    fee=fee,
-                    fiat_currency=fiat_currency,
-                    fiat_rate=fiat_rate,
-                    fiat_fee=fiat_fee,
-                    capital_gain=capital_gain
-                )
-                self.add_history_node(node_data, parents, tx_item)
-
-            for asset in value.assets:
-
-                if not should_show(asset):
-                    continue
-
-                asset_name = asset
-                amount = value.assets[asset]
-                balance = tx_item['balance'].assets[asset]
-
-                node_data = HistoryNodeData(
-                    lightning=lightning,
-                    timestamp=timestamp,
-                    txid=txid,
-                    confirmations=confirmations,
-                    label=label,
-                    asset_name=asset_name,
-                    amount=amount,
-                    balance=balance,
-                    fiat_value=None,
-                    fiat_default=None,
-                    acquisition_price=None,
-                    fiat_gain=None,
-                    payment_hash=payment_hash,
-                    height=height,
-                    type=type,
-                    channel_id=channel_id,
-                    preimage=preimage,
-                    fee=fee,
-                    fiat_currency=None,
-                    fiat_rate=None,
-                    fiat_fee=None,
-                    capital_gain=None
-                )
-                self.add_history_node(node_data, parents, tx_item)
-
-        new_length = self._root.childCount()
-        self.beginInsertRows(QModelIndex(), 0, new_length - 1)
-        self.transactions = transactions
-        self.endInsertRows()
+        if not force and self.update_incrementally(transactions):
+            self.view.filter()
+            return
+        # full rebuild: keep the view from repainting between the removal and the re-insertion
+        self.view.setUpdatesEnabled(False)
+        try:
+            self._rebuild(transactions)
+        finally:
+            self.view.setUpdatesEnabled(True)
 
         if selected_row:
             self.view.selectionModel().select(self.createIndex(selected_row, 0),
@@ -481,28 +696,31 @@ class HistoryModel(CustomModel, Logger):
                 end_date = self.transactions.value_from_pos(len(self.transactions) - 1).get('date') or end_date
             self.view.years = [str(i) for i in range(start_date.year, end_date.year + 1)]
             self.view.period_combo.insertItems(1, self.view.years)
-        # update tx_status_cache
-        self.tx_status_cache.clear()
-        for txid, tx_item in self.transactions.items():
-            if not tx_item.get('lightning', False):
-                tx_mined_info = self.tx_mined_info_from_tx_item(tx_item)
-                self.tx_status_cache[txid] = self.parent.wallet.get_tx_status(txid, tx_mined_info)
 
     def set_visibility_of_columns(self):
         def set_visible(col: int, b: bool):
             self.view.showColumn(col) if b else self.view.hideColumn(col)
 
+        # the fiat headers depend on the same settings
+        self._headers = None
+        history = self.parent.fx.show_history()
+        cap_gains = self.parent.fx.get_history_capital_gains_config()
+        # this runs on every refresh: only touch the header when something changed
+        visibility = (history, cap_gains)
+        if visibility == self._column_visibility:
+            return
+        self._column_visibility = visibility
         # txid
         set_visible(HistoryColumns.TXID, False)
         # fiat
-        history = self.parent.fx.show_history()
-        cap_gains = self.parent.fx.get_history_capital_gains_config()
         set_visible(HistoryColumns.FIAT_VALUE, history)
         set_visible(HistoryColumns.FIAT_ACQ_PRICE, history and cap_gains)
         set_visible(HistoryColumns.FIAT_CAP_GAINS, history and cap_gains)
 
     def update_fiat(self, idx):
-        tx_item = idx.internalPointer().get_data()
+        node = idx.internalPointer()
+        node.invalidate_cache()
+        tx_item = node.get_data()
         txid = tx_item.txid
         fee = tx_item.fee
         value = tx_item.amount.value
@@ -512,37 +730,49 @@ class HistoryModel(CustomModel, Logger):
             setattr(tx_item, key, fiat_fields[key])
         self.dataChanged.emit(idx, idx, [Qt.DisplayRole, Qt.ForegroundRole])
 
-    def update_tx_mined_status(self, tx_hash: str, tx_mined_info: TxMinedInfo):
-        try:
-            row = self.transactions.pos_from_key(tx_hash)
-            tx_item = self.transactions[tx_hash]
-        except KeyError:
-            return
+    def set_tx_status(self, tx_hash: str, tx_mined_info: TxMinedInfo):
         self.tx_status_cache[tx_hash] = self.parent.wallet.get_tx_status(tx_hash, tx_mined_info)
+        if tx_mined_info.conf > 0:
+            self.unconfirmed_txs.pop(tx_hash, None)
+        else:
+            self.unconfirmed_txs[tx_hash] = tx_mined_info
+
+    def _set_tx_mined_status(self, tx_hash: str, tx_mined_info: TxMinedInfo) -> bool:
+        """Like update_tx_mined_status, but without notifying the view.
+        Returns False if the tx is not in the history."""
+        tx_item = self.transactions.get(tx_hash)
+        if tx_item is None:
+            self.unconfirmed_txs.pop(tx_hash, None)
+            return False
+        self.set_tx_status(tx_hash, tx_mined_info)
         tx_item.update({
             'confirmations': tx_mined_info.conf,
             'timestamp': tx_mined_info.timestamp,
             'txpos_in_block': tx_mined_info.txpos,
             'date': timestamp_to_datetime(tx_mined_info.timestamp),
         })
-        topLeft = self.createIndex(row, 0)
-        bottomRight = self.createIndex(row, len(HistoryColumns) - 1)
-        self.dataChanged.emit(topLeft, bottomRight)
+        return True
+
+    def update_tx_mined_status(self, tx_hash: str, tx_mined_info: TxMinedInfo):
+        if self._set_tx_mined_status(tx_hash, tx_mined_info):
+            self.emit_status_changed((tx_hash,))
 
     def on_fee_histogram(self):
-        for tx_hash, tx_item in list(self.transactions.items()):
-            if tx_item.get('lightning'):
-                continue
-            tx_mined_info = self.tx_mined_info_from_tx_item(tx_item)
-            if tx_mined_info.conf > 0:
-                # note: we could actually break here if we wanted to rely on the order of txns in self.transactions
-                continue
-            self.update_tx_mined_status(tx_hash, tx_mined_info)
+        # only the unconfirmed txs can change status with the fee histogram
+        updated = [tx_hash for tx_hash, tx_mined_info in list(self.unconfirmed_txs.items())
+                   if self._set_tx_mined_status(tx_hash, tx_mined_info)]
+        self.emit_status_changed(updated)
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: Qt.ItemDataRole):
         assert orientation == Qt.Horizontal
         if role != Qt.DisplayRole:
             return None
+        # called on every header repaint; rebuilt after set_visibility_of_columns()
+        if self._headers is None:
+            self._headers = self._make_headers()
+        return self._headers[section]
+
+    def _make_headers(self) -> Dict[int, str]:
         fx = self.parent.fx
         fiat_title = 'n/a fiat value'
         fiat_acq_title = 'n/a fiat acquisition price'
@@ -561,7 +791,7 @@ class HistoryModel(CustomModel, Logger):
             HistoryColumns.FIAT_ACQ_PRICE: fiat_acq_title,
             HistoryColumns.FIAT_CAP_GAINS: fiat_cg_title,
             HistoryColumns.TXID: 'TXID',
-        }[section]
+        }
 
     def flags(self, idx: QModelIndex) -> int:
         extra_flags = Qt.NoItemFlags  # type: Qt.ItemFlag
@@ -591,136 +821,21 @@ class AssetHistoryModel(HistoryModel):
         HistoryModel.__init__(self, parent)
         self.asset = asset
 
-    @profiler
-    def refresh(self, reason: str):
-        self.logger.info(f"refreshing... reason: {reason}")
-        assert self.parent.gui_thread == threading.current_thread(), 'must be called from GUI thread'
-        assert self.view, 'view not set'
-        if self.view.maybe_defer_update():
-            return
-        selected = self.view.selectionModel().currentIndex()
-        selected_row = None
-        if selected:
-            selected_row = selected.row()
-        fx = self.parent.fx
-        if fx: fx.history_used_spot = False
-        wallet = self.parent.wallet
-        self.set_visibility_of_columns()
-        transactions = wallet.get_full_history(
-            self.parent.fx,
-            onchain_domain=self.get_domain(),
-            include_lightning=self.should_include_lightning_payments())
-        if transactions == self.transactions:
+    def add_tx_nodes(self, tx_item, parents, should_show):
+        # this model only has rows for self.asset
+        amount = tx_item['value'].assets.get(self.asset)
+        if amount is None or not should_show(self.asset):
             return
-        old_length = self._root.childCount()
-        if old_length != 0:
-            self.beginRemoveRows(QModelIndex(), 0, old_length)
-            self.transactions.clear()
-            self._root = HistoryNode(self, None)
-            self.endRemoveRows()
-        parents = {}
-
-        def should_show(asset):
-            if asset != self.asset:
-                return False
-            should_show = True
-            if not self.parent.config.get('show_spam_assets', False):
-                for regex in self.parent.asset_blacklist:
-                    if re.search(regex, asset):
-                        should_show = False
-                        break
-
-                for regex in self.parent.asset_whitelist:
-                    if re.search(regex, asset):
-                        should_show = True
-                        break
-
-            return should_show
-
-        for tx_item in transactions.values():
+        g = tx_item.get
+        capital_gain = g('capital_gain')
+        node_data = HistoryNodeData(
+            g('lightning', False), g('timestamp'), g('type'), g('txid'), g('confirmations', 0), g('label'),
+            self.asset, amount, tx_item['balance'].assets[self.asset],
+            g('fiat_value'), g('fiat_default', False), g('acquisition_price'), capital_gain,
+            g('payment_hash'), g('height'), g('channel_id'), g('preimage'), g('fee'),
+            g('fiat_currency'), g('fiat_rate'), g('fiat_fee'), capital_gain)
+        self.add_history_node(node_data, parents, tx_item)
 
-            # Create separate rows for assets
-
-            value = tx_item['value']  # type: EvrmoreValue
-            lightning = tx_item.get('lightning', False)
-            timestamp = tx_item.get('timestamp')
-            txid = tx_item.get('txid')
-            confirmations = tx_item.get('confirmations', 0)
-            label = tx_item.get('label')
-            fiat_value = tx_item.get('fiat_value')
-            fiat_default = tx_item.get('fiat_default', False)
-            acqu_price = tx_item.get('acquisition_price')
-            fiat_gain = tx_item.get('capital_gain')
-            payment_hash = tx_item.get('payment_hash')
-            height = tx_item.get('height')
-            type = tx_item.get('type')
-            channel_id = tx_item.get('channel_id')
-            preimage = tx_item.get('preimage')
-            fee = tx_item.get('fee')
-            fiat_currency = tx_item.get('fiat_currency'),
-            fiat_rate = tx_item.get('fiat_rate'),
-            fiat_fee = tx_item.get('fiat_fee'),
-            capital_gain = tx_item.get('capital_gain')
-
-            for asset in value.assets:
-
-                if not should_show(asset):
-                    continue
-
-                asset_name = asset
-                amount = value.assets[asset]
-                balance = tx_item['balance'].assets[asset]
-
-                node_data = HistoryNodeData(
-                    lightning=lightning,
-                    timestamp=timestamp,
-                    txid=txid,
-                    confirmations=confirmations,
-                    label=label,
-                    asset_name=asset_name,
-                    amount=amount,
-                    balance=balance,
-                    fiat_value=fiat_value,
-                    fiat_default=fiat_default,
-                    acquisition_price=acqu_price,
-                    fiat_gain=fiat_gain,
-                    payment_hash=payment_hash,
-                    height=height,
-                    type=type,
-                    channel_id=channel_id,
-                    preimage=preimage,
-                    fee=fee,
-                    fiat_currency=fiat_currency,
-                    fiat_rate=fiat_rate,
-                    fiat_fee=fiat_fee,
-                    capital_gain=capital_gain
-                )
-                self.add_history_node(node_data, parents, tx_item)
-
-        new_length = self._root.childCount()
-        self.beginInsertRows(QModelIndex(), 0, new_length - 1)
-        self.transactions = transactions
-        self.endInsertRows()
-
-        if selected_row:
-            self.view.selectionModel().select(self.createIndex(selected_row, 0),
-                                              QItemSelectionModel.Rows | QItemSelectionModel.SelectCurrent)
-        self.view.filter()
-        # update time filter
-        if not self.view.years and self.transactions:
-            start_date = date.today()
-            end_date = date.today()
-            if len(self.transactions) > 0:
-                start_date = self.transactions.value_from_pos(0).get('date') or start_date
-                end_date = self.transactions.value_from_pos(len(self.transactions) - 1).get('date') or end_date
-            self.view.years = [str(i) for i in range(start_date.year, end_date.year + 1)]
-            self.view.period_combo.insertItems(1, self.view.years)
-        # update tx_status_cache
-        self.tx_status_cache.clear()
-        for txid, tx_item in self.transactions.items():
-            if not tx_item.get('lightning', False):
-                tx_mined_info = self.tx_mined_info_from_tx_item(tx_item)
-                self.tx_status_cache[txid] = self.parent.wallet.get_tx_status(txid, tx_mined_info)
 
 class HistoryList(MyTreeView, AcceptFileDragDrop):
     filter_columns = [HistoryColumns.STATUS,
@@ -728,19 +843,14 @@ class HistoryList(MyTreeView, AcceptFileDragDrop):
                       HistoryColumns.AMOUNT,
                       HistoryColumns.TXID]
 
-    def tx_item_from_proxy_row(self, proxy_row):
-        hm_idx = self.model().mapToSource(self.model().index(proxy_row, 0))
-        return hm_idx.internalPointer().get_data()
-
     def should_hide(self, proxy_row):
-        if self.start_date and self.end_date:
-            tx_item = self.tx_item_from_proxy_row(proxy_row)
-            date = tx_item['date']
-            if date:
-                in_interval = self.start_date <= date <= self.end_date
-                if not in_interval:
-                    return True
-            return False
+        # the date range is applied by self.proxy, rows outside it are not even in there
+        return None
+
+    def update_date_filter(self):
+        self.proxy.set_date_range(self.start_date, self.end_date)
+        # the proxy rows changed: re-apply the search filter on them
+        self.hide_rows()
 
     def __init__(self, parent, model: HistoryModel):
         super().__init__(parent, self.create_menu,
@@ -756,6 +866,8 @@ class HistoryList(MyTreeView, AcceptFileDragDrop):
         self.start_date = None
         self.end_date = None
         self.years = []
+        # (hm.transactions, from_timestamp, to_timestamp, detailed history)
+        self._detailed_history = None
         self.create_toolbar_buttons()
         self.wallet = self.parent.wallet  # type: Abstract_Wallet
         self.sortByColumn(HistoryColumns.STATUS, Qt.AscendingOrder)
@@ -790,7 +902,7 @@ class HistoryList(MyTreeView, AcceptFileDragDrop):
             self.end_date = datetime.datetime(year + 1, 1, 1)
             self.start_button.setText(_('From') + ' ' + self.format_date(self.start_date))
             self.end_button.setText(_('To') + ' ' + self.format_date(self.end_date))
-        self.hide_rows()
+        self.update_date_filter()
 
     def create_toolbar_buttons(self):
         self.period_combo = QComboBox()
@@ -809,18 +921,18 @@ class HistoryList(MyTreeView, AcceptFileDragDrop):
     def on_hide_toolbar(self):
         self.start_date = None
         self.end_date = None
-        self.hide_rows()
+        self.update_date_filter()
 
     def save_toolbar_state(self, state, config):
         config.set_key('show_toolbar_history', state)
 
     def select_start_date(self):
         self.start_date = self.select_date(self.start_button)
-        self.hide_rows()
+        self.update_date_filter()
 
     def select_end_date(self):
         self.end_date = self.select_date(self.end_button)
-        self.hide_rows()
+        self.update_date_filter()
 
     def select_date(self, button):
         d = WindowModalDialog(self, _("Select date"))
@@ -850,10 +962,39 @@ class HistoryList(MyTreeView, AcceptFileDragDrop):
         if not show_fiat:
             self.parent.show_message(_("Enable fiat exchange rate with history."))
             return
-        h = self.wallet.get_detailed_history(
-            from_timestamp=time.mktime(self.start_date.timetuple()) if self.start_date else None,
-            to_timestamp=time.mktime(self.end_date.timetuple()) if self.end_date else None,
-            fx=fx)
+        from_timestamp = time.mktime(self.start_date.timetuple()) if self.start_date else None
+        to_timestamp = time.mktime(self.end_date.timetuple()) if self.end_date else None
+        h = self._get_cached_detailed_history(from_timestamp, to_timestamp)
+        if h is not None:
+            self._show_summary_dialog(h)
+            return
+        transactions = self.hm.transactions
+
+        def task():
+            # walks the whole history and prices it: keep it off the GUI thread
+            return self.wallet.get_detailed_history(
+                from_timestamp=from_timestamp,
+                to_timestamp=to_timestamp,
+                fx=fx)
+
+        def on_success(h):
+            self._detailed_history = (transactions, from_timestamp, to_timestamp, h)
+            self._show_summary_dialog(h)
+        WaitingDialog(self, _('Computing summary...'), task,
+                      on_success, self.parent.on_error)
+
+    def _get_cached_detailed_history(self, from_timestamp, to_timestamp):
+        # the model replaces hm.transactions whenever the history changes,
+        # so a snapshot taken against the current one is still valid
+        cached = self._detailed_history
+        if cached is None:
+            return None
+        transactions, from_ts, to_ts, h = cached
+        if transactions is not self.hm.transactions or (from_ts, to_ts) != (from_timestamp, to_timestamp):
+            return None
+        return h
+
+    def _show_summary_dialog(self, h):
         summary = h['summary']
         if not summary:
             self.parent.show_message(_("Nothing to summarize."))
@@ -935,6 +1076,8 @@ class HistoryList(MyTreeView, AcceptFileDragDrop):
         tx_item = index.internalPointer().get_data()  # type: HistoryNodeData
         column = index.column()
         key = get_item_key(tx_item)
+        # labels and fiat values are edited in place, without a new history snapshot
+        self._detailed_history = None
         if column == HistoryColumns.DESCRIPTION:
             if self.wallet.set_label(key, text):  # changed
                 self.hm.update_label(index)
@@ -949,11 +1092,11 @@ class HistoryList(MyTreeView, AcceptFileDragDrop):
 
     def mouseDoubleClickEvent(self, event: QMouseEvent):
         org_idx: QModelIndex = self.indexAt(event.pos())
-        idx = self.proxy.mapToSource(org_idx)
-        if not idx.isValid():
+        if not org_idx.isValid():
             # can happen e.g. before list is populated for the first time
             return
-        tx_item = idx.internalPointer().get_data()
+        idx = self.proxy.mapToSource(org_idx)
+        tx_item = idx.internalPointer().get_data()  # type: HistoryNodeData
         if self.hm.flags(idx) & Qt.ItemIsEditable:
             super().mouseDoubleClickEvent(event)
         else:
@@ -975,12 +1118,12 @@ class HistoryList(MyTreeView, AcceptFileDragDrop):
 
     def add_copy_menu(self, menu, idx):
         cc = menu.addMenu(_("Copy"))
+        node = idx.internalPointer()  # type: HistoryNode
         for column in HistoryColumns:
             if self.isColumnHidden(column):
                 continue
             column_title = self.hm.headerData(column, Qt.Horizontal, Qt.DisplayRole)
-            idx2 = idx.sibling(idx.row(), column)
-            column_data = (self.hm.data(idx2, Qt.DisplayRole).value() or '').strip()
+            column_data = (node.get_display_data(column).value() or '').strip()
             cc.addAction(
                 column_title,
                 lambda text=column_data, title=column_title:
@@ -1106,36 +1249,33 @@ class HistoryList(MyTreeView, AcceptFileDragDrop):
         self.parent.show_message(_("Your wallet history has been successfully exported."))
 
     def do_export_history(self, file_name, is_csv):
-        hist = self.wallet.get_detailed_history(fx=self.parent.fx)
+        hist = self._get_cached_detailed_history(None, None)
+        if hist is None:
+            hist = self.wallet.get_detailed_history(fx=self.parent.fx)
+            self._detailed_history = (self.hm.transactions, None, None, hist)
         txns = hist['transactions']
-        lines = []
-        if is_csv:
+
+        def csv_rows():
+            # one row for the EVR amount, and one per asset
             for item in txns:
                 evr_value = item['bc_value']
+                txid = item['txid']
+                label = item.get('label', '')
+                confirmations = item['confirmations']
+                date = item['date']
                 val = evr_value.evr_value
-
                 if val != 0:
-                    lines.append([item['txid'],
-                                  item.get('label', ''),
-                                  item['confirmations'],
-                                  val,
-                                  '',
-                                  item.get('fiat_value', ''),
-                                  item.get('fee', ''),
-                                  item.get('fiat_fee', ''),
-                                  item['date']])
-
-                assets = evr_value.assets
-                for asset, val in assets.items():
-                    lines.append([item['txid'],
-                                  item.get('label', ''),
-                                  item['confirmations'],
-                                  val,
-                                  asset,
-                                  '',
-                                  '',
-                                  '',
-                                  item['date']])
+                    yield [txid,
+                           label,
+                           confirmations,
+                           val,
+                           '',
+                           item.get('fiat_value', ''),
+                           item.get('fee', ''),
+                           item.get('fiat_fee', ''),
+                           date]
+                for asset, val in evr_value.assets.items():
+                    yield [txid, label, confirmations, val, asset, '', '', '', date]
 
         with open(file_name, "w+", encoding='utf-8') as f:
             if is_csv:
@@ -1150,15 +1290,17 @@ class HistoryList(MyTreeView, AcceptFileDragDrop):
                                       "fee",
                                       "fiat_fee",
                                       "timestamp"])
-                for line in lines:
-                    transaction.writerow(line)
+                transaction.writerows(csv_rows())
             else:
-                from electrum.util import json_encode
-                f.write(json_encode(txns))
+                # same output as json_encode(txns), but written out in chunks
+                # instead of being built as one string first
+                import json
+                from electrum.util import MyEncoder
+                json.dump(txns, f, indent=4, sort_keys=True, cls=MyEncoder)
 
     def get_text_from_coordinate(self, row, col):
         return self.get_role_data_from_coordinate(row, col, role=Qt.DisplayRole)
 
     def get_role_data_from_coordinate(self, row, col, *, role):
-        idx = self.model().mapToSource(self.model().index(row, col))
+        idx = self.proxy.mapToSource(self.proxy.index(row, col))
         return self.hm.data(idx, role).value()
@@ -39,7 +39,7 @@ from typing import Optional, TYPE_CHECKING, Sequence, List, Union, Dict, Set
 import concurrent.futures
 
 from PyQt5.QtGui import QPixmap, QKeySequence, QIcon, QCursor, QFont
-from PyQt5.QtCore import Qt, QRect, QStringListModel, QSize, pyqtSignal
+from PyQt5.QtCore import Qt, QRect, QStringListModel, QSize, pyqtSignal, QTimer
 from PyQt5.QtWidgets import (QMessageBox, QSystemTrayIcon, QTabWidget,
                              QMenuBar, QFileDialog, QCheckBox, QLabel,
                              QVBoxLayout, QGridLayout, QLineEdit,
@@ -207,6 +207,11 @@ class ElectrumWindow(QMainWindow, MessageBoxMixin, Logger, QtEventListener):
 
         self.create_status_bar()
         self.need_update = threading.Event()
+        # new headers arrive in bursts while syncing: refresh the tabs at most once per interval
+        self._refresh_tabs_timer = QTimer(self)
+        self._refresh_tabs_timer.setSingleShot(True)
+        self._refresh_tabs_timer.setInterval(150)  # msec
+        self._refresh_tabs_timer.timeout.connect(self.refresh_tabs)
 
         self.completions = QStringListModel()
 
@@ -461,7 +466,7 @@ class ElectrumWindow(QMainWindow, MessageBoxMixin, Logger, QtEventListener):
     @qt_event_listener
     def on_event_blockchain_updated(self, *args):
         # update the number of confirmations in history
-        self.refresh_tabs()
+        self.schedule_refresh_tabs()
 
     @qt_event_listener
     def on_event_on_quotes(self, *args):
@@ -1142,6 +1147,11 @@ class ElectrumWindow(QMainWindow, MessageBoxMixin, Logger, QtEventListener):
             self.create_workspace.refresh_owners()
             self.reissue_workspace.refresh_owners()
 
+    def schedule_refresh_tabs(self):
+        """Calls refresh_tabs() soon, once for all the calls made in the meantime."""
+        if not self._refresh_tabs_timer.isActive():
+            self._refresh_tabs_timer.start()
+
     def refresh_tabs(self, wallet=None):
         self.history_model.refresh('refresh_tabs')
         self.receive_tab.request_list.refresh_all()
@@ -3166,6 +3176,7 @@ class ElectrumWindow(QMainWindow, MessageBoxMixin, Logger, QtEventListener):
         if self.tray:
             self.tray = None
         self.gui_object.timer.timeout.disconnect(self.timer_actions)
+        self._refresh_tabs_timer.stop()
         self.gui_object.close_window(self)
 
     # TODO: On mac, this cannot be closed; disabled for now